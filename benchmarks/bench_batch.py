@@ -0,0 +1,51 @@
+"""
+Solve many small same-shaped games one Game at a time and in one
+Game.solve_batch call
+
+Usage: python benchmarks/bench_batch.py [--games 10000] [--counts 3 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from q1 import Game  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--counts", type=int, nargs="+", default=[3, 3])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    player_count = len(args.counts)
+    rng = np.random.default_rng(args.seed)
+    payoff_stack = rng.integers(
+        0, 5, size=[args.games] + args.counts + [player_count], dtype=np.int64
+    )
+
+    start = time.perf_counter()
+    expected = []
+    for payoffs in payoff_stack:
+        g = Game(player_count, args.counts, [], payoffs)
+        expected.append((g.list_all_psne(), g.list_all_vwdse()))
+    one_by_one = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = Game.solve_batch(player_count, args.counts, payoff_stack)
+    batched = time.perf_counter() - start
+    assert results == expected
+
+    print(f"{args.games} games of shape {args.counts}")
+    print(f"one Game per game: {one_by_one:.3f}s")
+    print(f"solve_batch:       {batched:.3f}s ({one_by_one / batched:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Best response dynamics against exhaustive enumeration on singleton
+congestion games, which are potential games and always converge
+
+Usage: python benchmarks/bench_best_response.py [--players 6 8 9] [--resources 6]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators import congestion_game  # noqa: E402
+from q1 import Game  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--players", type=int, nargs="+", default=[6, 8, 9])
+    parser.add_argument("--resources", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'players':>8} {'payoffs':>12} {'enumeration':>12} {'dynamics':>10}")
+    for player_count in args.players:
+        counts = [args.resources] * player_count
+        payoffs = congestion_game(counts, rng)
+
+        start = time.perf_counter()
+        psne_list = Game(player_count, counts, [], payoffs).list_all_psne()
+        enumeration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        g = Game(player_count, counts, [], payoffs)
+        psne = g.find_psne_by_best_response(seed=args.seed)
+        dynamics = time.perf_counter() - start
+        assert psne in psne_list
+
+        print(
+            f"{player_count:>8} {payoffs.size:>12} {enumeration:>11.3f}s"
+            f" {dynamics:>9.4f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
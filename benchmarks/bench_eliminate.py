@@ -0,0 +1,81 @@
+"""
+Compare PSNE searches with and without iterated elimination of strictly
+dominated strategies: dominance solvable games shrink to one profile and
+are searched about ten times faster at millions of profiles, while games
+with nothing dominated pay one min and max pass per player; a game only
+asked for VWDSE never builds the reduced game
+
+Usage: python benchmarks/bench_eliminate.py [--shapes 4x12 5x10 6x8]
+"""
+
+import argparse
+import itertools
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators import (  # noqa: E402
+    coordination_game,
+    dominance_solvable_game,
+    random_game,
+)
+from q1 import Game  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "--shapes",
+        nargs="+",
+        default=["4x12", "5x10", "6x8"],
+        help="players x strategies",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'game':>18} {'shape':>6} {'profiles':>10} {'kept':>10} {'full':>10}"
+        f" {'eliminate':>10} {'speedup':>8} {'vwdse only':>11}"
+    )
+    for generator, shape in itertools.product(
+        (dominance_solvable_game, random_game, coordination_game), args.shapes
+    ):
+        player_count, strategy_count = map(int, shape.split("x"))
+        counts = [strategy_count] * player_count
+        payoffs = generator(counts, np.random.default_rng(args.seed))
+        name = generator.__name__.replace("_game", "")
+
+        start = time.perf_counter()
+        expected = Game(player_count, counts, [], payoffs).list_all_psne()
+        full_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reduced = Game(
+            player_count, counts, [], payoffs, eliminate_dominated_strategies=True
+        )
+        assert reduced.list_all_psne() == expected
+        eliminate_time = time.perf_counter() - start
+        kept = reduced.payoffs[..., 0].size
+        if reduced.reduced_game is not None:
+            kept = reduced.reduced_game.payoffs[..., 0].size
+
+        # the reduced game is never built when only VWDSE are asked for
+        start = time.perf_counter()
+        Game(
+            player_count, counts, [], payoffs, eliminate_dominated_strategies=True
+        ).list_all_vwdse()
+        vwdse_time = time.perf_counter() - start
+
+        print(
+            f"{name:>18} {shape:>6} {strategy_count ** player_count:>10} {kept:>10}"
+            f" {full_time:>9.4f}s {eliminate_time:>9.4f}s"
+            f" {full_time / eliminate_time:>7.1f}x {vwdse_time:>10.4f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
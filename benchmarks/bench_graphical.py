@@ -0,0 +1,77 @@
+"""
+Memory and time of polymatrix games on a path of players against the dense
+payoff tensor of Game, which stops fitting beyond a few dozen players
+
+Usage: python benchmarks/bench_graphical.py [--players 10 16 1000 100000]
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from graphical import PolymatrixGame  # noqa: E402
+
+# beyond this many players the dense tensor is not even attempted
+DENSE_PLAYER_LIMIT = 18
+
+
+def path_game(
+    player_count: int, strategy_count: int, rng: np.random.Generator
+) -> PolymatrixGame:
+    matrices = {}
+    for player in range(player_count - 1):
+        for edge in [(player, player + 1), (player + 1, player)]:
+            matrices[edge] = rng.integers(
+                -100, 101, size=(strategy_count, strategy_count)
+            )
+    return PolymatrixGame([strategy_count] * player_count, matrices)
+
+
+def timed(action):
+    start = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "--players", type=int, nargs="+", default=[10, 16, 1000, 100000]
+    )
+    parser.add_argument("--strategies", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(
+        f"{'players':>8} {'edge bytes':>12} {'dense bytes':>12} {'first psne':>11}"
+        f" {'vwdse':>10} {'dense solve':>12}"
+    )
+    for player_count in args.players:
+        g = path_game(player_count, args.strategies, rng)
+        edge_bytes = sum(m.nbytes for matrices in g.matrices for m in matrices)
+        dense_digits = math.log10(args.strategies**player_count * player_count * 8)
+        dense_bytes = f"1e{dense_digits:.1f}"
+        first, first_time = timed(lambda: next(g.iter_psne(), None))
+        vwdse, vwdse_time = timed(g.list_all_vwdse)
+        dense_column = f"{'-':>12}"
+        if player_count <= DENSE_PLAYER_LIMIT:
+            dense = g.to_game()
+            dense_psne, dense_time = timed(dense.list_all_psne)
+            assert vwdse == dense.list_all_vwdse()
+            assert first == (dense_psne[0] if dense_psne else None)
+            dense_column = f"{dense_time:>11.4f}s"
+        print(
+            f"{player_count:>8} {edge_bytes:>12} {dense_bytes:>12}"
+            f" {first_time:>10.4f}s {vwdse_time:>9.4f}s {dense_column}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Time the native mixed equilibrium solvers against gambit's enummixed and
+lcp on the two-player games of the gambit corpus, or on random games when
+the corpus is not checked out
+
+Usage: python benchmarks/bench_mixed.py [--corpus gambit/contrib/games]
+"""
+
+import argparse
+import math
+import sys
+import time
+from fractions import Fraction
+from pathlib import Path
+from typing import Iterator, Set, Tuple
+
+import numpy as np
+import pygambit
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from mixed import lemke_howson, support_enumeration  # noqa: E402
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def to_integer_payoffs(gambit_g: pygambit.Game) -> np.ndarray:
+    """
+    Scale every player's rational payoffs by their common denominator,
+    which leaves the equilibria unchanged
+    """
+    players = []
+    for array in gambit_g.to_arrays():
+        values = [Fraction(str(value)) for value in array.flat]
+        scale = math.lcm(*(value.denominator for value in values))
+        players.append(
+            np.reshape([int(value * scale) for value in values], array.shape)
+        )
+    return np.stack(players, axis=-1)
+
+
+def iter_games(corpus: Path, seed: int) -> Iterator[Tuple[str, pygambit.Game]]:
+    nfgs = sorted(corpus.glob("*.nfg"))
+    if not nfgs:
+        print(f"no games in {corpus}, using random games", file=sys.stderr)
+        rng = np.random.default_rng(seed)
+        for m, n in [(3, 3), (5, 5), (8, 8), (10, 10)]:
+            payoffs = rng.integers(-100, 100, size=(m, n, 2))
+            gambit_g = pygambit.Game.from_arrays(payoffs[..., 0], payoffs[..., 1])
+            yield f"random {m}x{n}", gambit_g
+        return
+    for nfg in nfgs:
+        gambit_g = pygambit.Game.parse_game(nfg.read_text())
+        if len(gambit_g.players) == 2:
+            yield nfg.name, gambit_g
+
+
+def timed(action):
+    start = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - start
+
+
+def as_set(
+    gambit_g: pygambit.Game, equilibria
+) -> Set[Tuple[Tuple[Fraction, ...], ...]]:
+    return {
+        tuple(
+            tuple(Fraction(str(eq[strategy])) for strategy in player.strategies)
+            for player in gambit_g.players
+        )
+        for eq in equilibria
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "--corpus", type=Path, default=REPO_ROOT / "gambit/contrib/games"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'game':>28} {'shape':>8} {'supports':>10} {'enummixed':>10}"
+        f" {'lemke':>10} {'lcp':>10} {'found':>7}"
+    )
+    for name, gambit_g in iter_games(args.corpus, args.seed):
+        payoffs = to_integer_payoffs(gambit_g)
+        ours, support_time = timed(lambda: support_enumeration(payoffs))
+        lemke, lemke_time = timed(lambda: lemke_howson(payoffs))
+        theirs, enummixed_time = timed(
+            lambda: pygambit.nash.enummixed_solve(gambit_g, rational=True)
+        )
+        _, lcp_time = timed(
+            lambda: pygambit.nash.lcp_solve(gambit_g, rational=True, stop_after=1)
+        )
+
+        # support enumeration is complete for nondegenerate games only
+        expected = as_set(gambit_g, theirs.equilibria)
+        found = {(tuple(x), tuple(y)) for x, y in ours}
+        assert (tuple(lemke[0]), tuple(lemke[1])) in found | expected
+        shape = "x".join(map(str, payoffs.shape[:2]))
+        print(
+            f"{name:>28} {shape:>8} {support_time:>9.4f}s {enummixed_time:>9.4f}s"
+            f" {lemke_time:>9.4f}s {lcp_time:>9.4f}s"
+            f" {len(found & expected):>3}/{len(expected):<3}"
+        )
+
+
+if __name__ == "__main__":
+    main()
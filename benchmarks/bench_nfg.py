@@ -0,0 +1,78 @@
+"""
+Time loading a large .nfg file by parsing it against mapping its .npy
+sidecar, for the payoff and the outcome format
+
+Usage: python benchmarks/bench_nfg.py [--counts 64 64 64] [--repeat 3]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators import random_game  # noqa: E402
+from q1 import Game  # noqa: E402
+
+
+def write_nfg(directory: Path, payoffs: np.ndarray) -> tuple:
+    player_count = payoffs.ndim - 1
+    counts = list(payoffs.shape[:-1])
+    nfg_axes = list(range(player_count - 1, -1, -1)) + [player_count]
+    flat = payoffs.transpose(nfg_axes).reshape(-1, player_count)
+    players = " ".join(f'"P{pidx + 1}"' for pidx in range(player_count))
+    header = f'NFG 1 R "benchmark" {{ {players} }}'
+
+    payoff_path = directory / "payoff.nfg"
+    with open(payoff_path, "w") as f:
+        f.write(f'{header} {{ {" ".join(map(str, counts))} }}\n""\n\n')
+        f.write(" ".join(map(str, flat.reshape(-1))) + "\n")
+
+    outcome_path = directory / "outcome.nfg"
+    with open(outcome_path, "w") as f:
+        f.write(f"{header}\n\n{{ ")
+        for count in counts:
+            f.write("{ " + " ".join(f'"{i}"' for i in range(count)) + " }\n")
+        f.write('}\n""\n\n{\n')
+        for row in flat:
+            f.write('{ "" ' + ", ".join(map(str, row)) + " }\n")
+        f.write("}\n" + " ".join(map(str, range(1, len(flat) + 1))) + "\n")
+    return payoff_path, outcome_path
+
+
+def timed_load(path: Path, sidecar: bool, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        Game.from_nfg(path, sidecar=sidecar)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[64, 64, 64])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    payoffs = random_game(args.counts, np.random.default_rng(args.seed))
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'format':>8} {'MB':>8} {'parse':>10} {'sidecar':>10} {'speedup':>8}")
+        for path in write_nfg(Path(directory), payoffs):
+            parse = timed_load(path, False, args.repeat)
+            Game.from_nfg(path)
+            mapped = timed_load(path, True, args.repeat)
+            size = path.stat().st_size / 1e6
+            print(
+                f"{path.stem:>8} {size:>8.1f} {parse:>9.4f}s {mapped:>9.4f}s"
+                f" {parse / mapped:>7.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
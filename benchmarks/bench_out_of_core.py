@@ -0,0 +1,73 @@
+"""
+Solve a memory mapped game in blocks and report the peak heap usage
+against the in-memory path
+
+Usage: python benchmarks/bench_out_of_core.py [--size 1e7] [--budget 64e6]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from q1 import Game, map_payoffs  # noqa: E402
+
+
+def measure(make_game):
+    tracemalloc.start()
+    start = time.perf_counter()
+    psne = make_game().list_all_psne()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return psne, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--size", type=float, default=1e7)
+    parser.add_argument("--players", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=64e6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    side = max(2, round((args.size / args.players) ** (1 / args.players)))
+    counts = [side] * args.players
+    rng = np.random.default_rng(args.seed)
+    payoffs = rng.integers(0, 10, size=counts + [args.players], dtype=np.int64)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "payoffs.npy"
+        np.save(path, payoffs)
+        del payoffs
+        print(f"{path.stat().st_size / 2**20:.0f} MB payoff file, shape {counts}")
+
+        expected, elapsed, peak = measure(
+            lambda: Game(args.players, counts, [], np.load(path))
+        )
+        print(f"in memory: {elapsed:.3f}s, peak heap {peak / 2**20:.1f} MB")
+
+        psne, elapsed, peak = measure(
+            lambda: Game(
+                args.players,
+                counts,
+                [],
+                map_payoffs(path),
+                memory_budget=int(args.budget),
+            )
+        )
+        assert psne == expected
+        print(
+            f"mapped, budget {args.budget / 2**20:.0f} MB: {elapsed:.3f}s,"
+            f" peak heap {peak / 2**20:.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Time writing the results of a game where every profile is a PSNE: the old
+per-line printing of lists, the bulk text writer and the binary formats
+
+Usage: python benchmarks/bench_output.py [--counts 128 128 128]
+"""
+
+import argparse
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from legacy import loop_print_results  # noqa: E402
+from q1 import Game, save_psne_array  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[128, 128, 128])
+    args = parser.parse_args()
+
+    player_count = len(args.counts)
+    payoffs = np.zeros(args.counts + [player_count], dtype=np.int8)
+    g = Game(player_count, args.counts, [], payoffs)
+    start = time.perf_counter()
+    psne_array, vwdses = g._solve_array()
+    solve_time = time.perf_counter() - start
+
+    # everything below starts from the same solved PSNE array
+    start = time.perf_counter()
+    old = io.StringIO()
+    psnes = Game._get_human_readable_strategy_list((psne_array - 1).tolist())
+    loop_print_results(psnes, vwdses, old)
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    text = io.StringIO()
+    Game._print_results(psne_array, vwdses, text)
+    text_time = time.perf_counter() - start
+    assert text.getvalue() == old.getvalue()
+
+    print(f"{len(psne_array)} PSNE, {len(old.getvalue()) / 1e6:.1f}MB text")
+    print(f"solve {solve_time:.3f}s")
+    print(f"{'writer':>12} {'seconds':>10}")
+    print(f"{'print lines':>12} {old_time:>10.3f}")
+    print(f"{'bulk text':>12} {text_time:>10.3f}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ["psne.npy", "psne.i32"]:
+            start = time.perf_counter()
+            save_psne_array(psne_array, Path(directory) / name)
+            print(f"{Path(name).suffix:>12} {time.perf_counter() - start:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Peak memory and time of PSNE from the bit-packed best response index
+against the fused comparison pass, and of single profile PSNE lookups
+
+Usage: python benchmarks/bench_packed_index.py [--counts 256 256 256] [--lookups 10000]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators import coordination_game  # noqa: E402
+from q1 import Game  # noqa: E402
+
+
+def measured(action):
+    """
+    Returns: result, seconds, peak bytes allocated by NumPy and Python
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = action()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[256, 256, 256])
+    parser.add_argument("--lookups", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    player_count = len(args.counts)
+    payoffs = coordination_game(args.counts, rng)
+    profile_count = int(np.prod(args.counts))
+
+    # maxima are shared by both, so they are found before measuring
+    fused = Game(player_count, args.counts, [], payoffs)
+    fused.maximum_values
+    expected, fused_time, fused_peak = measured(fused.list_all_psne)
+    comparisons = player_count * profile_count * 8
+
+    indexed = Game(player_count, args.counts, [], payoffs)
+    indexed.maximum_values
+    index, build_time, build_peak = measured(lambda: indexed.best_response_index)
+    psnes, find_time, find_peak = measured(indexed.list_all_psne)
+    assert psnes == expected
+
+    profiles = [
+        [int(rng.integers(1, count + 1)) for count in args.counts]
+        for _ in range(args.lookups)
+    ]
+    psne_set = set(map(tuple, expected))
+    start = time.perf_counter()
+    for profile in profiles:
+        assert indexed.is_psne(profile) == (tuple(profile) in psne_set)
+    lookup_time = (time.perf_counter() - start) / args.lookups
+
+    print(f"shape {args.counts}, {profile_count} profiles, {len(expected)} PSNE")
+    print(f"n int64 comparisons would take {comparisons / 1e6:>10.1f}MB")
+    print(f"index                          {index.nbytes / 1e6:>10.1f}MB")
+    print(f"{'':>14} {'seconds':>10} {'peak MB':>10}")
+    print(f"{'fused pass':>14} {fused_time:>10.4f} {fused_peak / 1e6:>10.1f}")
+    print(f"{'build index':>14} {build_time:>10.4f} {build_peak / 1e6:>10.1f}")
+    print(f"{'AND words':>14} {find_time:>10.4f} {find_peak / 1e6:>10.1f}")
+    print(f"is_psne lookup {lookup_time * 1e6:.2f}us")
+
+
+if __name__ == "__main__":
+    main()
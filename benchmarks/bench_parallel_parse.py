@@ -0,0 +1,67 @@
+"""
+Payoff parsing throughput in MB/s of read_vec() style splitting, the
+single process read_game() and read_game() with parallel workers
+
+Usage: python benchmarks/bench_parallel_parse.py [--payoffs 1e7] [--workers 2 4 8]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from q1 import read_game  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--payoffs", type=float, default=1e7)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    side = max(2, round((args.payoffs / args.players) ** (1 / args.players)))
+    counts = [side] * args.players
+    values = rng.integers(-(10**6), 10**6, size=side**args.players * args.players)
+    payoff_line = " ".join(map(str, values.tolist()))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "game.txt"
+        path.write_text(
+            f"{args.players}\n{' '.join(map(str, counts))}\n{payoff_line}\n"
+        )
+        megabytes = path.stat().st_size / 1e6
+        print(f"{values.size} payoffs, {megabytes:.1f}MB")
+        print(f"{'parser':>16} {'seconds':>10} {'MB/s':>10}")
+
+        def report(name: str, seconds: float) -> None:
+            print(f"{name:>16} {seconds:>10.3f} {megabytes / seconds:>10.1f}")
+
+        start = time.perf_counter()
+        lines = path.read_text().split("\n")
+        split = list(map(int, lines[2].split()))
+        report("read_vec split", time.perf_counter() - start)
+        assert len(split) == values.size
+        del split, lines
+
+        start = time.perf_counter()
+        _, _, payoffs = read_game(path)
+        report("read_game", time.perf_counter() - start)
+        assert np.array_equal(payoffs, values)
+
+        for workers in args.workers:
+            start = time.perf_counter()
+            _, _, payoffs = read_game(path, workers)
+            report(f"{workers} workers", time.perf_counter() - start)
+            assert np.array_equal(payoffs, values)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compare the bulk read_game() ingest against read_vec() plus the
+per-profile tensor fill
+
+Usage: python benchmarks/bench_parse.py [--sizes 1e5 1e6 1e7] [--loop-limit 1e6]
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from legacy import loop_read_payoffs  # noqa: E402
+from q1 import Game, read_game  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e5, 1e6, 1e7])
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--loop-limit", type=float, default=1e6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'payoffs':>12} {'MB':>8} {'bulk':>10} {'loops':>10} {'speedup':>9}")
+    for size in args.sizes:
+        side = max(2, round((size / args.players) ** (1 / args.players)))
+        counts = [side] * args.players
+        values = rng.integers(-1000, 1000, size=side**args.players * args.players)
+        payoff_line = " ".join(map(str, values.tolist()))
+        text = f"{args.players}\n{' '.join(map(str, counts))}\n{payoff_line}\n"
+        data = text.encode()
+
+        start = time.perf_counter()
+        player_count, strategy_counts, payoff_list = read_game(io.BytesIO(data))
+        g = Game(player_count, strategy_counts, payoff_list)
+        bulk = time.perf_counter() - start
+
+        loops = "skipped"
+        speedup = "-"
+        if values.size <= args.loop_limit:
+            start = time.perf_counter()
+            payoffs = loop_read_payoffs(payoff_line, counts)
+            elapsed = time.perf_counter() - start
+            assert (payoffs == g.payoffs).all()
+            loops = f"{elapsed:.3f}s"
+            speedup = f"{elapsed / bulk:.1f}x"
+
+        print(
+            f"{values.size:>12} {len(data) / 2**20:>8.1f} {bulk:>9.3f}s"
+            f" {loops:>10} {speedup:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
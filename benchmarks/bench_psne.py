@@ -0,0 +1,72 @@
+"""
+Compare the whole-tensor PSNE engine against the old per-profile loops
+
+Usage: python benchmarks/bench_psne.py [--sizes 1e6 1e7 1e8] [--loop-limit 1e6]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from legacy import loop_psne  # noqa: E402
+from q1 import Game, compact_payoffs  # noqa: E402
+
+
+def game_shape(entries: int, player_count: int) -> List[int]:
+    """
+    Strategy counts of a game with roughly the requested number of payoffs
+    """
+    per_player = max(2, round((entries / player_count) ** (1 / player_count)))
+    return [per_player] * player_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e6, 1e7, 1e8])
+    parser.add_argument("--players", type=int, default=3)
+    parser.add_argument("--loop-limit", type=float, default=1e6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(
+        f"{'entries':>12} {'shape':>20} {'vectorized':>12} {'int8':>12}"
+        f" {'loops':>12} {'speedup':>9}"
+    )
+    for size in args.sizes:
+        counts = game_shape(int(size), args.players)
+        payoffs = rng.integers(0, 10, size=counts + [args.players], dtype=np.int64)
+        g = Game(args.players, counts, [], payoffs)
+
+        start = time.perf_counter()
+        psne = g._get_all_psne()
+        vectorized = time.perf_counter() - start
+
+        compact = Game(args.players, counts, [], compact_payoffs(payoffs))
+        start = time.perf_counter()
+        assert compact._get_all_psne() == psne
+        compact_time = time.perf_counter() - start
+
+        loops = "skipped"
+        speedup = "-"
+        if payoffs.size <= args.loop_limit:
+            start = time.perf_counter()
+            assert loop_psne(g.payoffs) == psne
+            elapsed = time.perf_counter() - start
+            loops = f"{elapsed:.3f}s"
+            speedup = f"{elapsed / vectorized:.0f}x"
+
+        print(
+            f"{payoffs.size:>12} {str(counts):>20} {vectorized:>11.3f}s"
+            f" {compact_time:>11.3f}s {loops:>12} {speedup:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
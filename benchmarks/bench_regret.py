@@ -0,0 +1,61 @@
+"""
+Time the cached regret tensor: building it once, epsilon-PSNE queries
+reusing it, and top-k least regret profiles by partial selection against
+a full sort
+
+Usage: python benchmarks/bench_regret.py [--counts 256 256 256] [--k 100]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators import random_game  # noqa: E402
+from q1 import Game  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[256, 256, 256])
+    parser.add_argument("--k", type=int, default=100)
+    parser.add_argument("--epsilons", type=int, nargs="+", default=[0, 5, 10, 20])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    player_count = len(args.counts)
+    g = Game(player_count, args.counts, [], random_game(args.counts, rng))
+    g.maximum_values
+
+    start = time.perf_counter()
+    regret = g.regret
+    build = time.perf_counter() - start
+    print(
+        f"shape {args.counts}, regret tensor of {regret.dtype}, {regret.nbytes / 1e6:.1f}MB"
+    )
+    print(f"build regret {build:.3f}s")
+
+    for epsilon in args.epsilons:
+        start = time.perf_counter()
+        close = g.list_epsilon_psne(epsilon)
+        elapsed = time.perf_counter() - start
+        print(f"epsilon {epsilon:>4}: {len(close):>9} profiles {elapsed:>8.4f}s")
+
+    start = time.perf_counter()
+    top = g.top_k_min_regret(args.k)
+    partial = time.perf_counter() - start
+    start = time.perf_counter()
+    flat = regret.T.reshape(-1)
+    order = np.argsort(flat, kind="stable")[: args.k]
+    full = time.perf_counter() - start
+    assert [r for _, r in top] == flat[order].tolist()
+    print(f"top {args.k}: argpartition {partial:.4f}s, full argsort {full:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
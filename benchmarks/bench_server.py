@@ -0,0 +1,115 @@
+"""
+Per game latency of the solver server against one q1.py process per game
+
+Usage: python benchmarks/bench_server.py [--games 200] [--counts 4 4 4] [--workers 2]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators import random_game  # noqa: E402
+from server import read_response  # noqa: E402
+
+SRC = Path(__file__).parent.parent / "src"
+
+
+def to_stdin_layout(payoffs: np.ndarray) -> bytes:
+    player_count = payoffs.ndim - 1
+    nfg_axes = list(range(player_count - 1, -1, -1)) + [player_count]
+    payoff_line = " ".join(map(str, payoffs.transpose(nfg_axes).reshape(-1)))
+    counts_line = " ".join(map(str, payoffs.shape[:-1]))
+    return f"{player_count}\n{counts_line}\n{payoff_line}\n".encode()
+
+
+def summarize(name: str, latencies: List[float]) -> None:
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{name:>12} {statistics.mean(latencies) * 1e3:>9.2f}ms"
+        f" {statistics.median(latencies) * 1e3:>9.2f}ms {p99 * 1e3:>9.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--counts", type=int, nargs="+", default=[4, 4, 4])
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    games = [to_stdin_layout(random_game(args.counts, rng)) for _ in range(args.games)]
+    player_count = len(args.counts)
+
+    process_latencies: List[float] = []
+    expected: List[bytes] = []
+    for game in games:
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, str(SRC / "q1.py")],
+            input=game,
+            capture_output=True,
+            check=True,
+        )
+        process_latencies.append(time.perf_counter() - start)
+        expected.append(result.stdout)
+
+    # startup is paid once, so it is reported apart from the latencies
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, str(SRC / "server.py"), "--workers", str(args.workers)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    assert server.stdin is not None and server.stdout is not None
+    server.stdin.write(games[0])
+    server.stdin.flush()
+    assert read_response(server.stdout, player_count) == expected[0]
+    startup = time.perf_counter() - start
+
+    server_latencies: List[float] = []
+    for game, output in zip(games, expected):
+        start = time.perf_counter()
+        server.stdin.write(game)
+        server.stdin.flush()
+        assert read_response(server.stdout, player_count) == output
+        server_latencies.append(time.perf_counter() - start)
+
+    # all games written up front, answers pipelined through the workers;
+    # writing from a thread keeps both pipes from filling up at once
+    def send_all() -> None:
+        assert server.stdin is not None
+        server.stdin.write(b"".join(games))
+        server.stdin.flush()
+
+    start = time.perf_counter()
+    writer = threading.Thread(target=send_all)
+    writer.start()
+    for output in expected:
+        assert read_response(server.stdout, player_count) == output
+    pipelined = time.perf_counter() - start
+    writer.join()
+    server.stdin.close()
+    server.wait()
+
+    print(f"{args.games} games of shape {args.counts}")
+    print(f"{'mode':>12} {'mean':>11} {'median':>11} {'p99':>11}")
+    summarize("process", process_latencies)
+    summarize("server", server_latencies)
+    print(f"server startup {startup * 1e3:.1f}ms")
+    print(f"pipelined {pipelined / args.games * 1e3:.3f}ms per game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compare the symmetric mode, which checks only sorted profiles, against
+full enumeration on symmetric games, where congestion games have large
+orbits of PSNE to expand and coordination games only a few
+
+Usage: python benchmarks/bench_symmetric.py [--shapes 6x4 8x4 10x3]
+"""
+
+import argparse
+import itertools
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators import congestion_game, coordination_game  # noqa: E402
+from q1 import Game  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "--shapes",
+        nargs="+",
+        default=["6x4", "8x4", "10x3", "12x3"],
+        help="players x strategies",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'game':>13} {'shape':>6} {'profiles':>10} {'sorted':>8} {'full':>10}"
+        f" {'symmetric':>10} {'speedup':>8}"
+    )
+    for generator, shape in itertools.product(
+        (congestion_game, coordination_game), args.shapes
+    ):
+        player_count, strategy_count = map(int, shape.split("x"))
+        counts = [strategy_count] * player_count
+        payoffs = generator(counts, np.random.default_rng(args.seed))
+        name = generator.__name__.replace("_game", "")
+
+        full = Game(player_count, counts, [], payoffs)
+        start = time.perf_counter()
+        expected = (full.list_all_psne(), full.list_all_vwdse())
+        full_time = time.perf_counter() - start
+
+        symmetric = Game(player_count, counts, [], payoffs, symmetric=True)
+        start = time.perf_counter()
+        assert (symmetric.list_all_psne(), symmetric.list_all_vwdse()) == expected
+        symmetric_time = time.perf_counter() - start
+
+        sorted_count = math.comb(player_count + strategy_count - 1, player_count)
+        print(
+            f"{name:>13} {shape:>6} {strategy_count ** player_count:>10} {sorted_count:>8}"
+            f" {full_time:>9.4f}s {symmetric_time:>9.4f}s"
+            f" {full_time / symmetric_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
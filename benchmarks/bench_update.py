@@ -0,0 +1,65 @@
+"""
+Time single payoff updates with Game.update_payoffs against solving a new
+Game after every change
+
+Usage: python benchmarks/bench_update.py [--counts 32 32 32] [--updates 100]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators import random_game  # noqa: E402
+from q1 import Game  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[32, 32, 32])
+    parser.add_argument("--updates", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    player_count = len(args.counts)
+    payoffs = random_game(args.counts, rng)
+    profiles = [
+        [int(rng.integers(1, count + 1)) for count in args.counts]
+        for _ in range(args.updates)
+    ]
+    values = rng.integers(-100, 101, size=(args.updates, player_count))
+
+    g = Game(player_count, args.counts, [], payoffs.copy())
+    start = time.perf_counter()
+    g.update_payoffs(profiles[:1], values[:1])
+    g.list_all_psne()
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for profile, profile_values in zip(profiles[1:], values[1:]):
+        g.update_payoffs([profile], [profile_values])
+        incremental_result = (g.list_all_psne(), g.list_all_vwdse())
+    incremental = (time.perf_counter() - start) / (args.updates - 1)
+
+    start = time.perf_counter()
+    for profile, profile_values in zip(profiles, values):
+        payoffs[tuple(np.array(profile) - 1)] = profile_values
+        fresh = Game(player_count, args.counts, [], payoffs)
+        rebuilt_result = (fresh.list_all_psne(), fresh.list_all_vwdse())
+    rebuilt = (time.perf_counter() - start) / args.updates
+    assert incremental_result == rebuilt_result
+
+    print(f"shape {args.counts}, {args.updates} single profile updates")
+    print(f"first update (builds state) {first * 1e3:>10.3f}ms")
+    print(f"update and query            {incremental * 1e3:>10.3f}ms")
+    print(f"new Game and solve          {rebuilt * 1e3:>10.3f}ms")
+    print(f"speedup {rebuilt / incremental:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Scaling of the PSNE search over process pools of different sizes
+
+Usage: python benchmarks/bench_workers.py [--size 1e8] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from q1 import Game  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--size", type=float, default=1e8)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    side = max(2, round((args.size / args.players) ** (1 / args.players)))
+    counts = [side] * args.players
+    rng = np.random.default_rng(args.seed)
+    payoffs = rng.integers(0, 4, size=counts + [args.players], dtype=np.int64)
+    print(f"{payoffs.size} payoffs, shape {counts}, {os.cpu_count()} cpus")
+
+    baseline = None
+    expected = None
+    for workers in args.workers:
+        g = Game(args.players, counts, [], payoffs, workers=workers)
+        start = time.perf_counter()
+        psne = g.list_all_psne()
+        elapsed = time.perf_counter() - start
+        if expected is None:
+            expected, baseline = psne, elapsed
+        assert psne == expected
+        print(f"{workers:>3} workers: {elapsed:.3f}s ({baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Seeded generators of synthetic games, each returning a payoff matrix of
+shape strategy_counts + [player_count]
+"""
+
+from typing import Callable, Dict, List
+
+import numpy as np
+import numpy.typing as npt
+
+Generator = Callable[[List[int], np.random.Generator], npt.NDArray[np.int64]]
+
+
+def random_game(
+    strategy_counts: List[int], rng: np.random.Generator
+) -> npt.NDArray[np.int64]:
+    """
+    Independent uniform payoffs
+    """
+    shape = strategy_counts + [len(strategy_counts)]
+    return rng.integers(-100, 101, size=shape, dtype=np.int64)
+
+
+def coordination_game(
+    strategy_counts: List[int], rng: np.random.Generator
+) -> npt.NDArray[np.int64]:
+    """
+    Identical interests: everybody gets the size of the largest group of
+    players agreeing on a strategy, plus a shared per-strategy bonus
+    """
+    strategies = np.indices(strategy_counts)
+    bonus = rng.integers(0, len(strategy_counts), size=max(strategy_counts))
+    common = np.zeros(strategy_counts, dtype=np.int64)
+    for strategy in range(max(strategy_counts)):
+        agreeing = (strategies == strategy).sum(axis=0)
+        common = np.maximum(common, agreeing * (bonus[strategy] + 1))
+    return np.repeat(common[..., np.newaxis], len(strategy_counts), axis=-1)
+
+
+def zero_sum_game(
+    strategy_counts: List[int], rng: np.random.Generator
+) -> npt.NDArray[np.int64]:
+    """
+    Random payoffs for all but the last player, who pays for all of them
+    """
+    payoffs = random_game(strategy_counts, rng)
+    payoffs[..., -1] = -payoffs[..., :-1].sum(axis=-1)
+    return payoffs
+
+
+def dominance_solvable_game(
+    strategy_counts: List[int], rng: np.random.Generator
+) -> npt.NDArray[np.int64]:
+    """
+    Each player ranks its own strategies with gaps wider than the noise
+    added by the other players, so one strategy strictly dominates
+    """
+    strategies = np.indices(strategy_counts)
+    payoffs = random_game(strategy_counts, rng) % 100
+    for pidx, count in enumerate(strategy_counts):
+        rank = rng.permutation(count)
+        payoffs[..., pidx] += 100 * rank[strategies[pidx]]
+    return payoffs
+
+
+def degenerate_game(
+    strategy_counts: List[int], rng: np.random.Generator
+) -> npt.NDArray[np.int64]:
+    """
+    All ties: every profile is a PSNE and every strategy is dominant
+    """
+    return np.zeros(strategy_counts + [len(strategy_counts)], dtype=np.int64)
+
+
+def congestion_game(
+    strategy_counts: List[int], rng: np.random.Generator
+) -> npt.NDArray[np.int64]:
+    """
+    Singleton congestion game: every player picks one resource and pays a
+    cost linear in the number of players sharing it
+    """
+    resource_count = max(strategy_counts)
+    slope = rng.integers(1, 5, size=resource_count)
+    offset = rng.integers(0, 10, size=resource_count)
+    strategies = np.indices(strategy_counts)
+    payoffs: List[npt.NDArray[np.int64]] = []
+    for pidx in range(len(strategy_counts)):
+        load = (strategies == strategies[pidx]).sum(axis=0)
+        payoffs.append(-(slope[strategies[pidx]] * load + offset[strategies[pidx]]))
+    return np.stack(payoffs, axis=-1)
+
+
+GENERATORS: Dict[str, Generator] = {
+    "random": random_game,
+    "coordination": coordination_game,
+    "zero_sum": zero_sum_game,
+    "dominance_solvable": dominance_solvable_game,
+    "degenerate": degenerate_game,
+    "congestion": congestion_game,
+}
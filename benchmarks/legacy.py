@@ -0,0 +1,93 @@
+"""
+Reference implementations of the per-profile loops Game used to run,
+kept so that benchmarks can report speedups against them
+"""
+
+from typing import List, Optional, TextIO
+
+import numpy as np
+import numpy.typing as npt
+
+
+def increment(strategy_list: List[int], strategy_counts: List[int]) -> bool:
+    """
+    Start by incrementing the first player's current strategy number
+    and then cascade/rollover into further players as necessary
+    Return True if all increments are exhausted by rolling over
+    """
+    for idx, count in enumerate(strategy_counts):
+        strategy_list[idx] += 1
+        if strategy_list[idx] != count:
+            return False
+        strategy_list[idx] = 0
+    return True
+
+
+def loop_read_payoffs(line: str, strategy_counts: List[int]) -> npt.NDArray[np.int64]:
+    """
+    Parse a payoff line with read_vec() and fill the tensor profile by profile
+    """
+    player_count = len(strategy_counts)
+    full_payoff_list = list(map(int, line.split()))
+    payoffs_mat = np.zeros(strategy_counts + [player_count], dtype=np.int64)
+    current_strategies = [0 for _ in range(player_count)]
+    payoff_list_index = 0
+    while True:
+        payoffs_mat[tuple(current_strategies)] = full_payoff_list[
+            payoff_list_index : payoff_list_index + player_count
+        ]
+        payoff_list_index += player_count
+        if increment(current_strategies, strategy_counts):
+            break
+    return payoffs_mat
+
+
+def loop_psne(payoffs: npt.NDArray[np.int64]) -> List[List[int]]:
+    """
+    Find the axis maxima and then the PSNE by walking every profile
+    """
+    strategy_counts = list(payoffs.shape[:-1])
+    player_count = len(strategy_counts)
+    axis_maxima = np.full([i + 1 for i in strategy_counts], -np.inf)
+    matrix_index = [0 for _ in range(player_count)]
+    while True:
+        value = payoffs[tuple(matrix_index)]
+        for pidx in range(player_count):
+            old = matrix_index[pidx]
+            matrix_index[pidx] = strategy_counts[pidx]
+            indexing = tuple(matrix_index)
+            axis_maxima[indexing] = max(axis_maxima[indexing], value[pidx])
+            matrix_index[pidx] = old
+        if increment(matrix_index, strategy_counts):
+            break
+
+    psne_list: List[List[int]] = []
+    while True:
+        is_max = True
+        for pidx in range(player_count):
+            my_utility = payoffs[tuple(matrix_index)][pidx]
+            old = matrix_index[pidx]
+            matrix_index[pidx] = strategy_counts[pidx]
+            maximum_axis_utility = axis_maxima[tuple(matrix_index)]
+            matrix_index[pidx] = old
+            if my_utility < maximum_axis_utility:
+                is_max = False
+                break
+        if is_max:
+            psne_list.append(list(matrix_index))
+        if increment(matrix_index, strategy_counts):
+            break
+    return psne_list
+
+
+def loop_print_results(
+    psnes: List[List[int]], vwdses: List[List[int]], file: Optional[TextIO] = None
+) -> None:
+    """
+    Print the results with one print() call per line
+    """
+    print(len(psnes), file=file)
+    for psne in psnes:
+        print(" ".join(map(str, psne)), file=file)
+    for vwdse in vwdses:
+        print(len(vwdse), " ".join(map(str, vwdse)), file=file)
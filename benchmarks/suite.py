@@ -0,0 +1,186 @@
+"""
+Benchmark suite: times every phase of Game on synthetic games and writes
+JSON results that can be compared between commits
+
+Usage:
+    python benchmarks/suite.py run [--output results.json] [--max-payoffs 4e6]
+    python benchmarks/suite.py compare old.json new.json [--threshold 1.25]
+"""
+
+import argparse
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators import GENERATORS  # noqa: E402
+from q1 import Game, read_game  # noqa: E402
+
+REPO_ROOT = Path(__file__).parent.parent
+PHASES = ["parse", "squeeze", "maxima", "psne", "vwdse"]
+
+
+def measure(action: Callable[[], Any]) -> Tuple[Any, float, int]:
+    """
+    Returns: result of action, wall time and peak traced allocation size
+    """
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    result = action()
+    elapsed = time.perf_counter() - start
+    return result, elapsed, tracemalloc.get_traced_memory()[1]
+
+
+def run_case(payoffs: np.ndarray) -> Dict[str, Dict[str, float]]:
+    """
+    Time each phase of solving a game given through the stdin layout
+    """
+    player_count = payoffs.ndim - 1
+    nfg_axes = list(range(player_count - 1, -1, -1)) + [player_count]
+    payoff_line = " ".join(map(str, payoffs.transpose(nfg_axes).reshape(-1)))
+    counts_line = " ".join(map(str, payoffs.shape[:-1]))
+    data = f"{player_count}\n{counts_line}\n{payoff_line}\n".encode()
+
+    phases: Dict[str, Dict[str, float]] = {}
+    tracemalloc.start()
+    try:
+        parsed, seconds, peak = measure(lambda: read_game(io.BytesIO(data)))
+        phases["parse"] = {"seconds": seconds, "peak_bytes": peak}
+        g, seconds, peak = measure(lambda: Game(*parsed))
+        phases["squeeze"] = {"seconds": seconds, "peak_bytes": peak}
+        _, seconds, peak = measure(lambda: g.maximum_values)
+        phases["maxima"] = {"seconds": seconds, "peak_bytes": peak}
+        psne, seconds, peak = measure(g.list_all_psne)
+        phases["psne"] = {"seconds": seconds, "peak_bytes": peak}
+        _, seconds, peak = measure(g.list_all_vwdse)
+        phases["vwdse"] = {"seconds": seconds, "peak_bytes": peak}
+    finally:
+        tracemalloc.stop()
+    phases["psne"]["count"] = len(psne)
+    return phases
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(args: argparse.Namespace) -> None:
+    results: List[Dict[str, Any]] = []
+    for name in args.generators:
+        for player_count in args.players:
+            for strategy_count in args.strategies:
+                counts = [strategy_count] * player_count
+                if strategy_count**player_count * player_count > args.max_payoffs:
+                    continue
+                rng = np.random.default_rng(args.seed)
+                payoffs = GENERATORS[name](counts, rng)
+
+                # keep the fastest repeat of every phase
+                best: Dict[str, Dict[str, float]] = {}
+                for _ in range(args.repeat):
+                    for phase, numbers in run_case(payoffs).items():
+                        if (
+                            phase not in best
+                            or numbers["seconds"] < best[phase]["seconds"]
+                        ):
+                            best[phase] = numbers
+
+                case = f"{name}/{'x'.join(map(str, counts))}"
+                results.append(
+                    {"case": case, "generator": name, "counts": counts, "phases": best}
+                )
+                total = sum(best[phase]["seconds"] for phase in PHASES)
+                print(f"{case:>32} {total:>9.4f}s", file=sys.stderr)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "seed": args.seed,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def compare(args: argparse.Namespace) -> None:
+    """
+    Print per phase time ratios of new over old and fail on regressions
+    """
+    with open(args.old) as f:
+        old = {result["case"]: result for result in json.load(f)["results"]}
+    with open(args.new) as f:
+        new = {result["case"]: result for result in json.load(f)["results"]}
+
+    regressions = 0
+    print(f"{'case':>32} " + " ".join(f"{phase:>8}" for phase in PHASES))
+    for case in sorted(old.keys() & new.keys()):
+        ratios = []
+        for phase in PHASES:
+            old_seconds = old[case]["phases"][phase]["seconds"]
+            new_seconds = new[case]["phases"][phase]["seconds"]
+            # ignore noise on phases too quick to time reliably
+            if max(old_seconds, new_seconds) < args.min_seconds:
+                ratios.append("-")
+                continue
+            ratio = new_seconds / max(old_seconds, 1e-9)
+            if ratio > args.threshold:
+                regressions += 1
+                ratios.append(f"{ratio:.2f}!")
+            else:
+                ratios.append(f"{ratio:.2f}")
+        print(f"{case:>32} " + " ".join(f"{ratio:>8}" for ratio in ratios))
+
+    print(f"{regressions} regressions above {args.threshold}x")
+    sys.exit(1 if regressions else 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("--output", default="bench_results.json")
+    run_parser.add_argument(
+        "--generators", nargs="+", choices=list(GENERATORS), default=list(GENERATORS)
+    )
+    run_parser.add_argument("--players", type=int, nargs="+", default=[2, 3, 4, 6])
+    run_parser.add_argument(
+        "--strategies", type=int, nargs="+", default=[2, 8, 32, 128]
+    )
+    run_parser.add_argument("--max-payoffs", type=float, default=4e6)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.set_defaults(action=run)
+
+    compare_parser = commands.add_parser("compare", help="compare two runs")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=1.25)
+    compare_parser.add_argument("--min-seconds", type=float, default=0.005)
+    compare_parser.set_defaults(action=compare)
+
+    args = parser.parse_args()
+    args.action(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""
+Games whose payoffs are too many for the tensor of Game, since each player
+only cares about a few neighbors
+
+GraphicalGame keeps one table per player over its own and its neighbors'
+strategies, PolymatrixGame one matrix per edge whose rows are summed. Memory
+grows with those tables and edges instead of with the number of profiles,
+and PSNE checks, best responses and VWDSE only read neighborhoods
+
+Profiles and strategies are one-indexed as in Game.list_all_psne, players
+are numbered from 0 as the payoff axes of Game
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from q1 import Game
+
+
+class LocalGame(ABC):
+    """
+    Everything computed from the payoffs of a player's strategies against a
+    fixed profile of the others, which subclasses read off their neighbors
+    """
+
+    def __init__(self, strategy_counts: List[int], neighbors: List[List[int]]) -> None:
+        """
+        neighbors: for every player, the other players its payoffs depend on
+        """
+        if len(neighbors) != len(strategy_counts):
+            raise ValueError("expected a neighbor list for every player")
+        if any(count < 1 for count in strategy_counts):
+            raise ValueError("every player needs a strategy")
+        self.player_count = len(strategy_counts)
+        self.strategy_counts = list(strategy_counts)
+        for player, player_neighbors in enumerate(neighbors):
+            if player in player_neighbors or len(set(player_neighbors)) != len(
+                player_neighbors
+            ):
+                raise ValueError(f"neighbors of player {player} must be distinct")
+            if not all(0 <= other < self.player_count for other in player_neighbors):
+                raise ValueError(f"neighbors of player {player} must be players")
+        self.neighbors = [list(player_neighbors) for player_neighbors in neighbors]
+
+    @abstractmethod
+    def _get_strategy_payoffs(
+        self, player: int, profile: Sequence[int]
+    ) -> npt.NDArray[Any]:
+        """
+        profile: zero-indexed, only the entries of neighbors are read
+
+        Returns: payoffs of each of player's strategies against profile
+        """
+
+    @abstractmethod
+    def _get_payoff_tensor(self, player: int) -> npt.NDArray[Any]:
+        """
+        Returns: payoffs of player as an array broadcasting to the shape
+        strategy_counts, with axes of length one for non-neighbors
+        """
+
+    @abstractmethod
+    def _find_dominant_strategies(self, player: int) -> npt.NDArray[np.bool_]:
+        """
+        Returns: which strategies of player are very weakly dominant
+        """
+
+    def _to_indices(self, profile: Sequence[int]) -> List[int]:
+        if len(profile) != self.player_count:
+            raise ValueError(f"expected {self.player_count} strategies, got {profile}")
+        indices = [int(strategy) - 1 for strategy in profile]
+        if not all(0 <= s < c for s, c in zip(indices, self.strategy_counts)):
+            raise ValueError(f"profile {profile} out of range")
+        return indices
+
+    def _is_best_response(self, player: int, indices: Sequence[int]) -> bool:
+        our_payoffs = self._get_strategy_payoffs(player, indices)
+        return bool(our_payoffs[indices[player]] == our_payoffs.max())
+
+    def get_payoffs(self, profile: Sequence[int]) -> List[Any]:
+        """
+        Returns: payoff of every player at profile
+        """
+        indices = self._to_indices(profile)
+        return [
+            self._get_strategy_payoffs(player, indices)[indices[player]].item()
+            for player in range(self.player_count)
+        ]
+
+    def get_best_responses(self, player: int, profile: Sequence[int]) -> List[int]:
+        """
+        Returns: strategies of player maximizing its payoff against the
+        others' strategies in profile; player's own entry is ignored
+        """
+        our_payoffs = self._get_strategy_payoffs(player, self._to_indices(profile))
+        return (np.flatnonzero(our_payoffs == our_payoffs.max()) + 1).tolist()
+
+    def is_psne(self, profile: Sequence[int]) -> bool:
+        indices = self._to_indices(profile)
+        return all(
+            self._is_best_response(player, indices)
+            for player in range(self.player_count)
+        )
+
+    def iter_psne(self) -> Iterator[List[int]]:
+        """
+        Depth first search fixing players from the last to the first, so
+        that the PSNE come out in NFG order; a player is checked as soon as
+        it and all of its neighbors are fixed, which prunes every extension
+        of a profile it would deviate from
+
+        On a path or a ring of neighbors most players are checked right
+        after being fixed, on a complete graph only full profiles are
+        """
+        if not self.player_count:
+            yield []
+            return
+        checked_at: List[List[int]] = [[] for _ in range(self.player_count)]
+        for player, player_neighbors in enumerate(self.neighbors):
+            checked_at[min([player] + player_neighbors)].append(player)
+
+        indices = [0] * self.player_count
+        player = self.player_count - 1
+        while True:
+            if all(
+                self._is_best_response(other, indices) for other in checked_at[player]
+            ):
+                if player == 0:
+                    yield [strategy + 1 for strategy in indices]
+                else:
+                    player -= 1
+                    indices[player] = 0
+                    continue
+            # next strategy of the deepest player that has one left
+            while indices[player] == self.strategy_counts[player] - 1:
+                if player == self.player_count - 1:
+                    return
+                player += 1
+            indices[player] += 1
+
+    def list_all_psne(self) -> List[List[int]]:
+        return list(self.iter_psne())
+
+    def list_all_vwdse(self) -> List[List[int]]:
+        return [
+            (np.flatnonzero(self._find_dominant_strategies(player)) + 1).tolist()
+            for player in range(self.player_count)
+        ]
+
+    def print_output(self, file: Optional[TextIO] = None) -> None:
+        """
+        Same output as Game.print_output gives for the dense game
+        """
+        Game._print_results(self.list_all_psne(), self.list_all_vwdse(), file)
+
+    def get_payoff_matrix(self) -> npt.NDArray[Any]:
+        """
+        Returns: the dense payoff tensor, of shape strategy_counts +
+        [player_count], only for games small enough to allocate it
+        """
+        return np.stack(
+            [
+                np.broadcast_to(self._get_payoff_tensor(player), self.strategy_counts)
+                for player in range(self.player_count)
+            ],
+            axis=-1,
+        )
+
+    def to_game(self, **kwargs: Any) -> Game:
+        """
+        kwargs: passed on to Game
+        """
+        return Game(
+            self.player_count,
+            self.strategy_counts,
+            [],
+            self.get_payoff_matrix(),
+            **kwargs,
+        )
+
+
+class GraphicalGame(LocalGame):
+    def __init__(
+        self,
+        strategy_counts: List[int],
+        neighbors: List[List[int]],
+        tables: Sequence[npt.ArrayLike],
+    ) -> None:
+        """
+        tables: for every player, its payoffs indexed by its own strategy
+        and then by the strategies of its neighbors, in the order given
+        """
+        super().__init__(strategy_counts, neighbors)
+        self.tables = [np.asarray(table) for table in tables]
+        if len(self.tables) != self.player_count:
+            raise ValueError("expected a payoff table for every player")
+        for player, table in enumerate(self.tables):
+            shape = tuple(
+                self.strategy_counts[other]
+                for other in [player] + self.neighbors[player]
+            )
+            if table.shape != shape:
+                raise ValueError(
+                    f"payoff table of player {player} has shape {table.shape},"
+                    f" expected {shape}"
+                )
+
+    @classmethod
+    def from_payoffs(cls, payoffs: npt.NDArray[Any]) -> "GraphicalGame":
+        """
+        payoffs: dense tensor of shape strategy_counts + [player_count]
+
+        Returns: the same game with everybody neighboring everybody
+        """
+        player_count = payoffs.ndim - 1
+        players = list(range(player_count))
+        neighbors = [players[:player] + players[player + 1 :] for player in players]
+        tables = [np.moveaxis(payoffs[..., player], player, 0) for player in players]
+        return cls(list(payoffs.shape[:-1]), neighbors, tables)
+
+    def _get_strategy_payoffs(
+        self, player: int, profile: Sequence[int]
+    ) -> npt.NDArray[Any]:
+        index = tuple(profile[other] for other in self.neighbors[player])
+        return self.tables[player][(slice(None),) + index]
+
+    def _get_payoff_tensor(self, player: int) -> npt.NDArray[Any]:
+        axes = [player] + self.neighbors[player]
+        shape = [1] * self.player_count
+        for axis in axes:
+            shape[axis] = self.strategy_counts[axis]
+        return self.tables[player].transpose(np.argsort(axes)).reshape(shape)
+
+    def _find_dominant_strategies(self, player: int) -> npt.NDArray[np.bool_]:
+        table = self.tables[player]
+        is_max = table == table.max(axis=0, keepdims=True)
+        return is_max.reshape(len(table), -1).all(axis=1)
+
+
+class PolymatrixGame(LocalGame):
+    def __init__(
+        self,
+        strategy_counts: List[int],
+        matrices: Dict[Tuple[int, int], npt.ArrayLike],
+    ) -> None:
+        """
+        matrices: for an edge (i, j), the payoffs player i gets from it,
+        indexed by the strategies of i and then j; the payoff of i is the
+        sum over its edges, and edges need not go both ways
+        """
+        neighbors: List[List[int]] = [[] for _ in strategy_counts]
+        for player, other in sorted(matrices):
+            if not 0 <= player < len(strategy_counts):
+                raise ValueError(f"edge ({player}, {other}) from a missing player")
+            neighbors[player].append(other)
+        super().__init__(strategy_counts, neighbors)
+        self.matrices: List[List[npt.NDArray[Any]]] = []
+        for player, others in enumerate(self.neighbors):
+            self.matrices.append([])
+            for other in others:
+                matrix = np.asarray(matrices[player, other])
+                shape = (self.strategy_counts[player], self.strategy_counts[other])
+                if matrix.shape != shape:
+                    raise ValueError(
+                        f"matrix of edge ({player}, {other}) has shape"
+                        f" {matrix.shape}, expected {shape}"
+                    )
+                self.matrices[player].append(matrix)
+
+    def _get_strategy_payoffs(
+        self, player: int, profile: Sequence[int]
+    ) -> npt.NDArray[Any]:
+        our_payoffs = np.zeros(self.strategy_counts[player], dtype=np.int64)
+        for other, matrix in zip(self.neighbors[player], self.matrices[player]):
+            our_payoffs = our_payoffs + matrix[:, profile[other]]
+        return our_payoffs
+
+    def _get_payoff_tensor(self, player: int) -> npt.NDArray[Any]:
+        tensor = np.zeros([1] * self.player_count, dtype=np.int64)
+        for other, matrix in zip(self.neighbors[player], self.matrices[player]):
+            shape = [1] * self.player_count
+            shape[player] = self.strategy_counts[player]
+            shape[other] = self.strategy_counts[other]
+            if other < player:
+                matrix = matrix.T
+            tensor = tensor + matrix.reshape(shape)
+        return tensor
+
+    def _find_dominant_strategies(self, player: int) -> npt.NDArray[np.bool_]:
+        """
+        The opponents' strategies enter the payoff difference of t and s in
+        separate terms, so the worst case of their sum over all opponent
+        profiles is the sum of each edge's worst case:
+
+            t is very weakly dominant
+            iff  sum_j min_{s_j} (A_ij[t, s_j] - A_ij[s, s_j]) >= 0  for all s
+        """
+        count = self.strategy_counts[player]
+        worst_margins = np.zeros((count, count), dtype=np.int64)
+        for matrix in self.matrices[player]:
+            # margins[t, s, s_j] of playing t over s against s_j
+            margins = matrix[:, np.newaxis, :] - matrix[np.newaxis, :, :]
+            worst_margins = worst_margins + margins.min(axis=2)
+        return (worst_margins >= 0).all(axis=1)
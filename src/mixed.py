@@ -0,0 +1,318 @@
+"""
+Mixed Nash equilibria of two-player games, found without calling gambit
+
+Both solvers take a payoff matrix of shape (m, n, 2), as Game.payoffs of a
+two-player game built with optimize_single_strategy_counts=False, and give
+equilibria as exact probability vectors of Fractions, verified exactly
+"""
+
+import itertools
+from fractions import Fraction
+from typing import Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+MixedProfile = Tuple[List[Fraction], List[Fraction]]
+
+# support pairs solved per batch of stacked linear systems
+SUPPORT_BATCH_SIZE = 4096
+
+
+def get_bimatrix(
+    payoffs: npt.NDArray[np.int64],
+) -> Tuple[npt.NDArray[np.object_], npt.NDArray[np.object_]]:
+    """
+    Returns: payoffs of the row and the column player as arrays of Python
+    integers, which never overflow in exact arithmetic
+    """
+    if payoffs.ndim != 3 or payoffs.shape[-1] != 2:
+        raise ValueError(f"expected payoffs of shape (m, n, 2), got {payoffs.shape}")
+    exact = np.vectorize(int, otypes=[object])(payoffs)
+    return exact[..., 0], exact[..., 1]
+
+
+def is_nash(
+    payoffs: npt.NDArray[np.int64], x: Sequence[Fraction], y: Sequence[Fraction]
+) -> bool:
+    """
+    Exact check that x and y are probability vectors and that each puts
+    weight only on best responses to the other
+
+    Returns: whether (x, y) is a Nash equilibrium
+    """
+    A, B = get_bimatrix(payoffs)
+    x_array = np.array(list(x), dtype=object)
+    y_array = np.array(list(y), dtype=object)
+    if x_array.shape != (A.shape[0],) or y_array.shape != (A.shape[1],):
+        return False
+    if sum(x_array) != 1 or sum(y_array) != 1:
+        return False
+    if (x_array < 0).any() or (y_array < 0).any():
+        return False
+    row_values = A.dot(y_array)
+    column_values = B.T.dot(x_array)
+    return bool(
+        (row_values[x_array > 0] == max(row_values)).all()
+        and (column_values[y_array > 0] == max(column_values)).all()
+    )
+
+
+def _solve_exact(
+    matrix: List[List[Fraction]], rhs: List[Fraction]
+) -> Optional[List[Fraction]]:
+    """
+    Gaussian elimination over the rationals
+
+    Returns: the unique solution, None if matrix is singular
+    """
+    size = len(rhs)
+    rows = [row + [value] for row, value in zip(matrix, rhs)]
+    for col in range(size):
+        pivot = next((r for r in range(col, size) if rows[r][col] != 0), None)
+        if pivot is None:
+            return None
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for r in range(size):
+            if r != col and rows[r][col] != 0:
+                factor = rows[r][col] / rows[col][col]
+                rows[r] = [a - factor * b for a, b in zip(rows[r], rows[col])]
+    return [rows[r][size] / rows[r][r] for r in range(size)]
+
+
+def _get_indifferent_mix(
+    matrix: npt.NDArray[np.object_], support: Sequence[int], size: int
+) -> Optional[List[Fraction]]:
+    """
+    matrix: payoffs of the indifferent player, one row per own strategy and
+    one column per strategy of the mixing player, restricted to supports
+
+    Returns: mix over size strategies, zero outside support, which makes
+    the other player indifferent between all rows, or None if not unique
+    """
+    k = len(support)
+    system = [[Fraction(v) for v in row] + [Fraction(-1)] for row in matrix.tolist()]
+    system.append([Fraction(1)] * k + [Fraction(0)])
+    solution = _solve_exact(system, [Fraction(0)] * k + [Fraction(1)])
+    if solution is None:
+        return None
+    mix = [Fraction(0)] * size
+    for strategy, probability in zip(support, solution):
+        mix[strategy] = probability
+    return mix
+
+
+def _iter_support_batches(
+    m: int, n: int, k: int
+) -> Iterator[Tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]]:
+    """
+    Yields row and column supports of size k as pairs of index arrays of
+    shape (pairs, k), SUPPORT_BATCH_SIZE pairs at a time
+    """
+    pairs = itertools.product(
+        itertools.combinations(range(m), k), itertools.combinations(range(n), k)
+    )
+    while True:
+        batch = list(itertools.islice(pairs, SUPPORT_BATCH_SIZE))
+        if not batch:
+            return
+        rows, columns = zip(*batch)
+        yield np.array(rows, dtype=np.intp), np.array(columns, dtype=np.intp)
+
+
+def _solve_indifference(
+    matrices: npt.NDArray[np.float64],
+) -> Tuple[npt.NDArray[np.bool_], npt.NDArray[np.float64]]:
+    """
+    matrices: stack of k x k payoff blocks, rows of the indifferent player
+
+    Returns: which systems are regular, and for those the mix over the
+    columns followed by the common value
+    """
+    count, k, _ = matrices.shape
+    systems = np.zeros((count, k + 1, k + 1))
+    systems[:, :k, :k] = matrices
+    systems[:, :k, k] = -1
+    systems[:, k, :k] = 1
+    rhs = np.zeros((count, k + 1, 1))
+    rhs[:, k] = 1
+    regular = np.abs(np.linalg.det(systems)) > 1e-9
+    solutions = np.zeros((count, k + 1))
+    if regular.any():
+        solutions[regular] = np.linalg.solve(systems[regular], rhs[regular])[..., 0]
+    return regular, solutions
+
+
+def _spread(
+    mixes: npt.NDArray[np.float64], supports: npt.NDArray[np.intp], size: int
+) -> npt.NDArray[np.float64]:
+    """
+    Returns: mixes over supports as full vectors over size strategies
+    """
+    full = np.zeros((len(mixes), size))
+    np.put_along_axis(full, supports, mixes, axis=1)
+    return full
+
+
+def support_enumeration(payoffs: npt.NDArray[np.int64]) -> List[MixedProfile]:
+    """
+    For every size k and every pair of supports of k strategies, solve the
+    indifference conditions of all pairs at once in floating point, then
+    redo the candidates passing the equilibrium checks in exact arithmetic
+
+    Finds all equilibria of nondegenerate games, and every PSNE of any game
+
+    Returns: distinct equilibria, sorted
+    """
+    A, B = get_bimatrix(payoffs)
+    A_float, B_float = payoffs[..., 0].astype(float), payoffs[..., 1].astype(float)
+    m, n = A.shape
+    scale = max(1.0, float(np.abs(payoffs).max(initial=0)))
+    tolerance = 1e-7 * scale
+
+    found: Set[Tuple[Tuple[Fraction, ...], Tuple[Fraction, ...]]] = set()
+    for k in range(1, min(m, n) + 1):
+        for rows, columns in _iter_support_batches(m, n, k):
+            blocks_a = A_float[rows[:, :, np.newaxis], columns[:, np.newaxis, :]]
+            blocks_b = B_float[rows[:, :, np.newaxis], columns[:, np.newaxis, :]]
+            regular_y, solution_y = _solve_indifference(blocks_a)
+            regular_x, solution_x = _solve_indifference(blocks_b.transpose(0, 2, 1))
+            y, row_value = solution_y[:, :k], solution_y[:, k]
+            x, column_value = solution_x[:, :k], solution_x[:, k]
+
+            # nonnegative mixes and no better reply outside the supports
+            row_values = np.einsum("ij,pj->pi", A_float, _spread(y, columns, n))
+            column_values = np.einsum("ij,pi->pj", B_float, _spread(x, rows, m))
+            candidates = (
+                regular_x
+                & regular_y
+                & (x >= -1e-9).all(axis=1)
+                & (y >= -1e-9).all(axis=1)
+                & (row_values <= row_value[:, np.newaxis] + tolerance).all(axis=1)
+                & (column_values <= column_value[:, np.newaxis] + tolerance).all(axis=1)
+            )
+            for pair in np.flatnonzero(candidates):
+                row_support, column_support = rows[pair], columns[pair]
+                block = A[np.ix_(row_support, column_support)]
+                exact_y = _get_indifferent_mix(block, column_support, n)
+                block = B[np.ix_(row_support, column_support)].T
+                exact_x = _get_indifferent_mix(block, row_support, m)
+                if exact_x is None or exact_y is None:
+                    continue
+                if is_nash(payoffs, exact_x, exact_y):
+                    found.add((tuple(exact_x), tuple(exact_y)))
+    return [(list(x), list(y)) for x, y in sorted(found)]
+
+
+class _Tableau:
+    """
+    Integer pivoting tableau of a best response polytope, with one column
+    per label and the right hand side last; all entries stay integers as
+    every pivot divides by the previous pivot element exactly
+    """
+
+    def __init__(self, matrix: npt.NDArray[np.object_], basis: List[int]) -> None:
+        self.matrix = matrix
+        self.basis = basis
+        self.lexicographic_columns = list(basis)
+        self.determinant = 1
+
+    def pivot(self, entering: int) -> int:
+        """
+        Returns: label of the variable leaving the basis
+        """
+        column = self.matrix[:, entering]
+        candidates = [row for row in range(len(column)) if column[row] > 0]
+        if not candidates:
+            raise RuntimeError("unbounded best response polytope")
+
+        # the lexicographic ratio test keeps degenerate games from cycling
+        def ratios(row: int) -> List[Fraction]:
+            return [
+                Fraction(self.matrix[row, col], column[row])
+                for col in [-1] + self.lexicographic_columns
+            ]
+
+        row = min(candidates, key=ratios)
+        pivot_row = self.matrix[row].copy()
+        pivot_value = column[row]
+        self.matrix = (
+            self.matrix * pivot_value - np.outer(column, pivot_row)
+        ) // self.determinant
+        self.matrix[row] = pivot_row
+        self.determinant = pivot_value
+        leaving = self.basis[row]
+        self.basis[row] = entering
+        return leaving
+
+    def get_mix(self, labels: range) -> List[Fraction]:
+        """
+        Returns: normalized values of the variables with the given labels
+        """
+        values = [Fraction(0)] * len(labels)
+        for row, label in enumerate(self.basis):
+            if label in labels:
+                values[label - labels.start] = Fraction(
+                    self.matrix[row, -1], self.matrix[row, label]
+                )
+        total = sum(values)
+        return [value / total for value in values]
+
+
+def lemke_howson(
+    payoffs: npt.NDArray[np.int64], initial_label: int = 0
+) -> MixedProfile:
+    """
+    initial_label: strategy whose label is dropped first, numbering the row
+    player's strategies 0 to m - 1 and the column player's m to m + n - 1
+
+    Follows the path of almost completely labeled vertex pairs of the best
+    response polytopes {x >= 0 : B^T x <= 1} and {y >= 0 : A y <= 1} from
+    the origin, with payoffs shifted to be positive, in exact arithmetic
+
+    Returns: the equilibrium at the end of the path
+    """
+    A, B = get_bimatrix(payoffs)
+    m, n = A.shape
+    if not 0 <= initial_label < m + n:
+        raise ValueError(f"initial_label must be below {m + n}")
+    A = A - min(A.min(), 0) + 1
+    B = B - min(B.min(), 0) + 1
+
+    # columns are labels: x then slacks of B^T x <= 1, slacks of A y <= 1 then y
+    ones_n = np.ones((n, 1), dtype=int).astype(object)
+    ones_m = np.ones((m, 1), dtype=int).astype(object)
+    identity_n = np.identity(n, dtype=int).astype(object)
+    identity_m = np.identity(m, dtype=int).astype(object)
+    row_tableau = _Tableau(np.hstack([B.T, identity_n, ones_n]), list(range(m, m + n)))
+    column_tableau = _Tableau(np.hstack([identity_m, A, ones_m]), list(range(m)))
+
+    # x_k is nonbasic in the first polytope, y_k in the second
+    if initial_label < m:
+        current, other = row_tableau, column_tableau
+    else:
+        current, other = column_tableau, row_tableau
+    leaving = current.pivot(initial_label)
+    while leaving != initial_label:
+        current, other = other, current
+        leaving = current.pivot(leaving)
+
+    x = row_tableau.get_mix(range(m))
+    y = column_tableau.get_mix(range(m, m + n))
+    if not is_nash(payoffs, x, y):
+        raise RuntimeError(
+            "Lemke-Howson ended on a profile that is not a Nash equilibrium"
+        )
+    return x, y
+
+
+def lemke_howson_all(payoffs: npt.NDArray[np.int64]) -> List[MixedProfile]:
+    """
+    Returns: distinct equilibria reached from every initial label, sorted
+    """
+    m, n = payoffs.shape[:2]
+    found = set()
+    for label in range(m + n):
+        x, y = lemke_howson(payoffs, label)
+        found.add((tuple(x), tuple(y)))
+    return [(list(x), list(y)) for x, y in sorted(found)]
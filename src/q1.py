@@ -1,30 +1,1101 @@
-from copy import deepcopy
-from typing import List, Optional
+import argparse
+import io
+import itertools
+import json
+import math
+import mmap
+import os
+import re
+import stat
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import numpy.typing as npt
 
+if TYPE_CHECKING:
+    # process pools, shared memory, the cache database and its digests are
+    # imported where they are used, sparing every other run their startup
+    import sqlite3
+    from multiprocessing import shared_memory
+
 
 def read_vec():
     return list(map(int, input().split()))
 
 
+# characters only found in rational or decimal numbers
+RATIONAL_MARKERS = (b"/", b".", b"e", b"E")
+
+
+def _may_be_clamped(numbers: npt.NDArray[np.int64]) -> bool:
+    """
+    np.fromstring clamps tokens beyond int64 to one of its limits, so a
+    value at a limit may not be the token it was parsed from
+    """
+    info = np.iinfo(np.int64)
+    return bool(((numbers == info.max) | (numbers == info.min)).any())
+
+
+def read_numbers(
+    source: Union[str, Path, BinaryIO, None] = None,
+) -> npt.NDArray[Any]:
+    """
+    source: path or binary stream, defaults to sys.stdin.buffer
+
+    Returns: every whitespace separated number of source, parsed in bulk
+    into int64, or if any of them is not an integer or does not fit
+    int64, their tokens as a bytes array that scale_payoffs() parses
+    exactly
+    """
+    if isinstance(source, (str, Path)):
+        data = Path(source).read_bytes()
+    else:
+        data = (source or sys.stdin.buffer).read()
+    if not re.search(rb"\S", data):
+        return np.zeros(0, dtype=np.int64)
+    if any(marker in data for marker in RATIONAL_MARKERS):
+        return np.array(data.split())
+    numbers = np.fromstring(data, dtype=np.int64, sep=" ")
+    if _may_be_clamped(numbers):
+        return np.array(data.split())
+    return numbers
+
+
+def _get_stdin_path() -> Optional[str]:
+    """
+    Returns: path of the regular file stdin is redirected from, read from
+    its start, if the system tells it, so that workers can map the file
+    """
+    try:
+        fd = sys.stdin.fileno()
+        if not stat.S_ISREG(os.fstat(fd).st_mode) or sys.stdin.buffer.tell():
+            return None
+        path = os.readlink(f"/proc/self/fd/{fd}")
+    except (AttributeError, OSError, ValueError):
+        return None
+    return path if os.path.isfile(path) else None
+
+
+def read_game(
+    source: Union[str, Path, BinaryIO, None] = None,
+    workers: int = 1,
+) -> Tuple[int, List[int], npt.NDArray[np.int64]]:
+    """
+    source: path or binary stream holding a game in the stdin layout,
+    defaults to sys.stdin.buffer
+    workers: processes parsing the payoffs of a path in parallel with
+    read_numbers_parallel(), after the header is read here
+
+    Parses the whole input in one pass instead of line by line
+
+    Returns: player count, strategy counts and the flat NFG payoff array
+    """
+    if workers > 1 and isinstance(source, (str, Path)):
+        with open(source, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                tokens = re.finditer(rb"\S+", mapped)
+                header = [next(tokens)]
+                header += itertools.islice(tokens, int(header[0].group()))
+                numbers = [int(token.group()) for token in header]
+                # the payoffs start right after the last strategy count
+                end = header[-1].end()
+                del tokens, header
+        payoffs = read_numbers_parallel(source, workers, end)
+        return numbers[0], numbers[1:], payoffs
+
+    numbers = read_numbers(source)
+    player_count = int(numbers[0])
+    strategy_counts = [int(count) for count in numbers[1 : player_count + 1]]
+    return player_count, strategy_counts, numbers[player_count + 1 :]
+
+
+def _to_fraction(value: Any) -> Fraction:
+    """
+    Floats are taken as the decimal they print as, so 0.1 is 1/10 rather
+    than the nearest binary fraction
+    """
+    if isinstance(value, (float, np.floating)):
+        return Fraction(repr(float(value)))
+    if isinstance(value, bytes):
+        value = value.decode()
+    if isinstance(value, np.integer):
+        value = int(value)
+    if isinstance(value, (str, int, Fraction, Decimal)):
+        return Fraction(value)
+    raise TypeError(f"not a rational payoff: {value!r}")
+
+
+# decimal digits that always fit int64
+INT64_DIGITS = 18
+
+
+def _reduce_decimal_scale(
+    numerators: npt.NDArray[np.int64], digits: int
+) -> Tuple[npt.NDArray[np.int64], int]:
+    """
+    numerators: one player's payoffs times 10 ** digits
+
+    Returns: the numerators divided by their largest common factor with
+    10 ** digits, and 10 ** digits divided by it, which is the least
+    common denominator of the payoffs
+    """
+    power = 10**digits
+    common = math.gcd(power, int(np.gcd.reduce(numerators)) if numerators.size else 0)
+    return numerators // common, power // common
+
+
+def _scale_decimal_tokens(
+    tokens: npt.NDArray[Any],
+) -> Optional[Tuple[npt.NDArray[np.int64], List[int]]]:
+    """
+    tokens: bytes or str of shape (profiles, players)
+
+    Decimals such as "-12.25" are parsed in bulk from the byte matrix of
+    the tokens: the digits are accumulated column by column, skipping the
+    point, and the digits after it give the power of ten to divide by
+
+    Returns: what scale_payoffs() does, None for tokens it does not parse,
+    such as "3/4" or "1e3", or whose numerators may not fit int64
+    """
+    if tokens.dtype.kind == "U":
+        try:
+            tokens = tokens.astype(np.bytes_)
+        except UnicodeEncodeError:
+            return None
+    width = tokens.dtype.itemsize
+    if not width:
+        return None
+    chars = np.ascontiguousarray(tokens).view(np.uint8).reshape(tokens.shape + (width,))
+    is_digit = (chars >= ord("0")) & (chars <= ord("9"))
+    is_point = chars == ord(".")
+    is_sign = np.zeros_like(is_digit)
+    is_sign[..., 0] = (chars[..., 0] == ord("-")) | (chars[..., 0] == ord("+"))
+    # tokens are padded with NUL bytes to the common width
+    known = is_digit | is_point | is_sign | (chars == 0)
+    digit_counts = is_digit.sum(axis=-1)
+    if (
+        not known.all()
+        or (is_point.sum(axis=-1) > 1).any()
+        or (digit_counts < 1).any()
+        or (digit_counts > INT64_DIGITS).any()
+    ):
+        return None
+
+    values = np.zeros(tokens.shape, dtype=np.int64)
+    for column in range(width):
+        digit = chars[..., column].astype(np.int64) - ord("0")
+        values = np.where(is_digit[..., column], values * 10 + digit, values)
+    values = np.where(chars[..., 0] == ord("-"), -values, values)
+    fraction_digits = (is_digit & (np.cumsum(is_point, axis=-1) > 0)).sum(axis=-1)
+
+    numerators = np.empty_like(values)
+    scales: List[int] = []
+    for pidx in range(tokens.shape[1]):
+        digits = int(fraction_digits[:, pidx].max(initial=0))
+        shifts = digits - fraction_digits[:, pidx]
+        if (digit_counts[:, pidx] + shifts > INT64_DIGITS).any():
+            return None
+        shifted = values[:, pidx] * np.power(10, shifts, dtype=np.int64)
+        numerators[:, pidx], scale = _reduce_decimal_scale(shifted, digits)
+        scales.append(scale)
+    return numerators, scales
+
+
+def _scale_floats(
+    values: npt.NDArray[np.floating],
+) -> Optional[Tuple[npt.NDArray[np.int64], List[int]]]:
+    """
+    values: floats of shape (profiles, players)
+
+    A float is taken as the decimal it prints as, which has at most k
+    digits after the point iff rounding it to k digits gives it back, so
+    each player's powers of ten are tried in bulk from 10 ** 0 up
+
+    Returns: what scale_payoffs() does, None for values that are not
+    finite, need more digits or whose numerators may not fit exactly
+    """
+    if not np.isfinite(values).all():
+        return None
+    numerators = np.empty(values.shape, dtype=np.int64)
+    scales: List[int] = []
+    for pidx in range(values.shape[1]):
+        column = values[:, pidx]
+        for digits in range(INT64_DIGITS - 2):
+            if np.array_equal(np.round(column, digits), column):
+                break
+        else:
+            return None
+        shifted = np.round(column * 10.0**digits)
+        # integers beyond 2 ** 53 may not be the decimal's numerator
+        if shifted.size and np.abs(shifted).max() >= 2**53:
+            return None
+        numerators[:, pidx], scale = _reduce_decimal_scale(
+            shifted.astype(np.int64), digits
+        )
+        scales.append(scale)
+    return numerators, scales
+
+
+def scale_payoffs(
+    payoffs: npt.NDArray[Any], player_count: int
+) -> Tuple[npt.NDArray[Any], List[int]]:
+    """
+    payoffs: rational payoffs in NFG order along the last axis, as
+    Fractions, Decimals, floats or strings such as "3/4" or "-0.25"
+
+    Multiplies each player's payoffs by their least common denominator,
+    which turns them into integers and keeps every comparison between
+    that player's payoffs exact. Float arrays and decimal tokens are
+    scaled in bulk, anything else one Fraction at a time
+
+    Returns: int64 payoffs, or Python integers in an object array if they
+    overflow int64, and the scale of every player
+    """
+    payoffs = np.asarray(payoffs)
+    if not player_count:
+        return np.zeros(payoffs.shape, dtype=np.int64), []
+    found = None
+    if payoffs.dtype.kind == "f":
+        found = _scale_floats(payoffs.reshape(-1, player_count))
+    elif payoffs.dtype.kind in "SU":
+        found = _scale_decimal_tokens(payoffs.reshape(-1, player_count))
+    if found is not None:
+        numerators, scales = found
+        return numerators.reshape(payoffs.shape), scales
+
+    exact = np.vectorize(_to_fraction, otypes=[object])(payoffs)
+    by_player = exact.reshape(exact.shape[:-1] + (-1, player_count))
+    scales = [
+        math.lcm(*(value.denominator for value in by_player[..., pidx].flat))
+        for pidx in range(player_count)
+    ]
+    scaled = np.vectorize(lambda value: value.numerator, otypes=[object])(
+        by_player * np.array(scales, dtype=object)
+    ).reshape(payoffs.shape)
+    info = np.iinfo(np.int64)
+    if scaled.size == 0 or (info.min <= scaled.min() and scaled.max() <= info.max):
+        scaled = scaled.astype(np.int64)
+    return scaled, scales
+
+
+def compact_payoffs(payoffs: npt.NDArray[np.int64]) -> npt.NDArray[np.integer]:
+    """
+    Returns: payoffs in the narrowest signed integer dtype holding their
+    range, which is the same array if nothing narrower fits
+    """
+    if payoffs.dtype == object:
+        return payoffs
+    if payoffs.size == 0:
+        return payoffs.astype(np.int8)
+    low, high = payoffs.min(), payoffs.max()
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return payoffs.astype(dtype)
+    return payoffs
+
+
+def nfg_to_tensor(
+    payoffs: npt.NDArray[np.int64], strategy_counts: List[int]
+) -> npt.NDArray[np.int64]:
+    """
+    payoffs: payoff array in NFG order along its last axis, any leading
+    axes index separate games
+
+    Returns: view of shape leading axes + strategy_counts + [player_count]
+    """
+    player_count = len(strategy_counts)
+    batch_shape = list(payoffs.shape[:-1])
+    batch_axes = list(range(len(batch_shape)))
+
+    # NFG lists profiles with the first player's strategy varying fastest,
+    # which is C order over the strategy axes taken in reverse
+    payoffs = payoffs.reshape(batch_shape + strategy_counts[::-1] + [player_count])
+    reversed_axes = [len(batch_shape) + pidx for pidx in range(player_count)][::-1]
+    return payoffs.transpose(batch_axes + reversed_axes + [payoffs.ndim - 1])
+
+
+# quoted strings with escapes, braces, and anything else between
+# whitespace, commas and braces
+NFG_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}]|[^\s{},"]+')
+
+
+# an outcome of the outcome list with an optional name, and the list's end
+NFG_OUTCOME = re.compile(rb'\s*\{\s*(?:"(?:[^"\\]|\\.)*")?([^{}"]*)\}')
+NFG_OUTCOME_END = re.compile(rb"\s*\}")
+
+
+def read_nfg(
+    source: Union[str, Path, bytes],
+) -> Tuple[int, List[int], npt.NDArray[Any]]:
+    """
+    source: path or contents of a Gambit .nfg file, either listing payoffs
+    of every profile or, in the outcome format, outcome numbers of every
+    profile after a list of outcomes, where 0 is the all zero outcome
+
+    Only the header is tokenized, outcomes take one regular expression
+    match each, and all numbers are parsed in bulk by read_numbers()
+
+    Returns: player count, strategy counts and the flat NFG payoff array
+    """
+    data = source if isinstance(source, bytes) else Path(source).read_bytes()
+    tokens = NFG_TOKEN.finditer(data)
+
+    def next_token() -> "re.Match[bytes]":
+        token = next(tokens, None)
+        if token is None:
+            raise ValueError("unexpected end of NFG file")
+        return token
+
+    def read_group() -> List[bytes]:
+        """
+        Returns: tokens up to the closing brace of a group just opened
+        """
+        group = []
+        while (token := next_token().group()) != b"}":
+            group.append(token)
+        return group
+
+    header = [next_token().group() for _ in range(4)]
+    if header[0] != b"NFG" or next_token().group() != b"{":
+        raise ValueError("not an NFG file")
+    player_count = len(read_group())
+
+    if next_token().group() != b"{":
+        raise ValueError("missing strategy list")
+    token = next_token()
+    is_outcome_format = token.group() == b"{"
+    if is_outcome_format:
+        # lists of strategy names, one per player
+        strategy_counts = [len(read_group())]
+        while next_token().group() == b"{":
+            strategy_counts.append(len(read_group()))
+    else:
+        strategy_counts = [int(token.group())] + list(map(int, read_group()))
+    if len(strategy_counts) != player_count:
+        raise ValueError("strategy list does not match the players")
+
+    # an optional comment precedes the outcomes or the payoffs
+    token = next_token()
+    start = token.end() if token.group().startswith(b'"') else token.start()
+    profile_count = int(np.prod(strategy_counts))
+    if not is_outcome_format:
+        payoffs = read_numbers(io.BytesIO(data[start:]))
+        if len(payoffs) != player_count * profile_count:
+            raise ValueError(f"expected {player_count * profile_count} payoffs")
+        return player_count, strategy_counts, payoffs
+
+    if token.group().startswith(b'"'):
+        token = next_token()
+    if token.group() != b"{":
+        raise ValueError("missing outcome list")
+    # one anchored match per outcome, their payoffs parsed in bulk after
+    outcomes: List[bytes] = []
+    position = token.end()
+    while outcome := NFG_OUTCOME.match(data, position):
+        outcomes.append(outcome.group(1))
+        position = outcome.end()
+    end = NFG_OUTCOME_END.match(data, position)
+    if end is None:
+        raise ValueError("unterminated outcome list")
+    values = read_numbers(io.BytesIO(b" ".join(outcomes).replace(b",", b" ")))
+    if len(values) != len(outcomes) * player_count:
+        raise ValueError(f"every outcome needs {player_count} payoffs")
+
+    zeros = np.zeros(player_count, dtype=np.int64).astype(values.dtype)
+    table = np.concatenate([zeros, values])
+    table = table.reshape(-1, player_count)
+    indices = read_numbers(io.BytesIO(data[end.end() :]))
+    if len(indices) != profile_count:
+        raise ValueError(f"expected {profile_count} outcome numbers")
+    if indices.dtype.kind not in "iu":
+        raise ValueError("outcome numbers must be integers")
+    if len(indices) and (indices.min() < 0 or indices.max() >= len(table)):
+        raise ValueError("outcome number out of range")
+    return player_count, strategy_counts, table[indices.astype(np.intp)].reshape(-1)
+
+
+def map_payoffs(
+    path: Union[str, Path],
+    strategy_counts: Optional[List[int]] = None,
+    dtype: npt.DTypeLike = np.int64,
+) -> npt.NDArray[np.int64]:
+    """
+    path: .npy file holding a payoff matrix, or a raw binary file holding
+    the payoffs in NFG order (strategy_counts and dtype are then required)
+
+    Returns: read-only payoff matrix backed by a memory map of the file
+    """
+    if Path(path).suffix == ".npy":
+        return np.load(path, mmap_mode="r")
+    if strategy_counts is None:
+        raise ValueError("strategy_counts is required for raw payoff files")
+    return nfg_to_tensor(np.memmap(path, dtype=dtype, mode="r"), strategy_counts)
+
+
+def is_symmetric(payoffs: npt.NDArray[Any]) -> bool:
+    """
+    Checks that all players have as many strategies and that payoffs are
+    invariant under a swap of the first two players and under a cyclic
+    shift of all players, which together generate every permutation
+
+    Returns: whether the game is symmetric
+    """
+    player_count = payoffs.ndim - 1
+    if len(set(payoffs.shape[:-1])) > 1:
+        return False
+    for permutation in (
+        [1, 0] + list(range(2, player_count)),
+        list(range(1, player_count)) + [0],
+    ):
+        if player_count < 2:
+            break
+        # player i of the permuted game is player permutation[i] of this one
+        permuted = payoffs.transpose(permutation + [player_count])
+        if not np.array_equal(permuted[..., permutation], payoffs):
+            return False
+    return True
+
+
+def _get_sorted_profiles(strategy_count: int, size: int) -> npt.NDArray[np.int64]:
+    """
+    Returns: every nondecreasing sequence of size strategies, one per row
+    """
+    profiles = itertools.combinations_with_replacement(range(strategy_count), size)
+    flat = np.fromiter(itertools.chain.from_iterable(profiles), dtype=np.int64)
+    return flat.reshape(math.comb(strategy_count + size - 1, size), size)
+
+
+def _rank_multisets(
+    multisets: npt.NDArray[np.int64], strategy_count: int
+) -> npt.NDArray[np.int64]:
+    """
+    multisets: rows of nondecreasing strategies
+
+    A sorted multiset c of size k maps to the set {c_i + i} of k distinct
+    numbers, whose colex rank is the sum of C(c_i + i, i + 1)
+
+    Returns: rank of every row, numbering all multisets of its size densely
+    """
+    size = multisets.shape[1]
+    binomials = np.array(
+        [
+            [math.comb(x, k) for k in range(size + 1)]
+            for x in range(strategy_count + size)
+        ],
+        dtype=np.int64,
+    )
+    ranks = np.zeros(len(multisets), dtype=np.int64)
+    for i in range(size):
+        ranks += binomials[multisets[:, i] + i, i + 1]
+    return ranks
+
+
+def _iter_distinct_permutations(profile: Sequence[int]) -> Iterator[Tuple[int, ...]]:
+    """
+    profile: nondecreasing strategies
+
+    Yields every distinct ordering of profile once, in lexicographic order
+    """
+    current = list(profile)
+    while True:
+        yield tuple(current)
+        i = len(current) - 2
+        while i >= 0 and current[i] >= current[i + 1]:
+            i -= 1
+        if i < 0:
+            return
+        j = len(current) - 1
+        while current[j] <= current[i]:
+            j -= 1
+        current[i], current[j] = current[j], current[i]
+        current[i + 1 :] = reversed(current[i + 1 :])
+
+
+# profiles checked per block when streaming PSNE from an in-memory game
+STREAM_BLOCK_PROFILES = 1 << 16
+
+
+def _iter_psne_lines(psne_array: npt.NDArray[np.int64]) -> Iterator[str]:
+    """
+    Yields: the lines print() gives for the PSNE rows, formatted in bulk
+    STREAM_BLOCK_PROFILES rows at a time by one str.format() call each
+    """
+    row_format = " ".join(["{}"] * psne_array.shape[1]) + "\n"
+    for start in range(0, len(psne_array), STREAM_BLOCK_PROFILES):
+        block = psne_array[start : start + STREAM_BLOCK_PROFILES]
+        yield (row_format * len(block)).format(*block.ravel().tolist())
+
+
+def save_psne_array(
+    psne_array: npt.NDArray[np.int64], target: Union[str, Path, BinaryIO]
+) -> None:
+    """
+    target: path, written in .npy format if its name ends in .npy and as
+    raw little endian int32 rows otherwise, or a binary stream for .npy
+
+    Both can be memory mapped by other tools, the raw file as an int32
+    array of shape (-1, player count)
+    """
+    psne_array = psne_array.astype("<i4")
+    if not isinstance(target, (str, Path)):
+        np.save(target, psne_array)
+    elif str(target).endswith(".npy"):
+        np.save(target, psne_array)
+    else:
+        psne_array.tofile(target)
+
+
+# (kind, name, byte offset, shape, strides, dtype) of an array that pool
+# workers attach to instead of receiving a pickled copy
+ArrayRef = Tuple[str, str, int, Tuple[int, ...], Tuple[int, ...], str]
+
+
+def _share_array(
+    array: npt.NDArray[Any],
+) -> Tuple[ArrayRef, Optional["shared_memory.SharedMemory"]]:
+    """
+    Memory mapped arrays are shared by file name and offset, anything else
+    is copied once into a new shared memory block which the caller must
+    unlink when done
+
+    Returns: reference for _attach_array, shared memory block or None
+    """
+    from multiprocessing import shared_memory
+
+    root = array
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    if isinstance(root, np.memmap) and root.filename is not None:
+        offset = root.offset + array.ctypes.data - root.ctypes.data
+        ref = (
+            "file",
+            root.filename,
+            offset,
+            array.shape,
+            array.strides,
+            array.dtype.str,
+        )
+        return ref, None
+
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared: npt.NDArray[Any] = np.ndarray(array.shape, array.dtype, buffer=block.buf)
+    shared[...] = array
+    ref = ("shm", block.name, 0, shared.shape, shared.strides, array.dtype.str)
+    return ref, block
+
+
+def _attach_array(ref: ArrayRef) -> Tuple[npt.NDArray[Any], Any]:
+    """
+    Returns: array described by ref, handle to close once the array is gone
+    """
+    from multiprocessing import shared_memory
+
+    kind, name, offset, shape, strides, dtype = ref
+    if kind == "file":
+        handle: Any = np.memmap(name, dtype=np.uint8, mode="r")
+        buffer = handle
+    else:
+        handle = shared_memory.SharedMemory(name=name)
+        buffer = handle.buf
+    array: npt.NDArray[Any] = np.ndarray(
+        shape, dtype, buffer=buffer, offset=offset, strides=strides
+    )
+    return array, handle
+
+
+# byte ranges per worker when parsing in parallel, so that slow ranges
+# do not leave the other workers idle
+CHUNKS_PER_WORKER = 4
+
+
+def _map_range(
+    path: Union[str, Path], start: int, stop: int
+) -> Tuple[npt.NDArray[np.uint8], mmap.mmap]:
+    """
+    Returns: bytes start to stop of the file as an array, and the map to
+    close once the array is gone
+    """
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    data = np.frombuffer(mapped, dtype=np.uint8, count=stop - start, offset=start)
+    return data, mapped
+
+
+def _count_tokens(path: Union[str, Path], start: int, stop: int) -> int:
+    """
+    Process pool task: number of whitespace separated tokens in a byte
+    range, which starts and ends next to whitespace or the file's ends
+    """
+    data, mapped = _map_range(path, start, stop)
+    # whitespace and control characters, neither of which occurs in numbers
+    is_space = data <= ord(" ")
+    del data
+    mapped.close()
+    if not len(is_space):
+        return 0
+    starts = np.count_nonzero(is_space[:-1] & ~is_space[1:])
+    return int(starts) + int(not is_space[0])
+
+
+def _parse_range(
+    path: Union[str, Path],
+    start: int,
+    stop: int,
+    out_ref: ArrayRef,
+    position: int,
+    count: int,
+) -> None:
+    """
+    Process pool task: parse the count integers of a byte range into the
+    shared output array, from position on
+
+    Raises OverflowError if an integer may not fit int64
+    """
+    data, mapped = _map_range(path, start, stop)
+    numbers = np.fromstring(data.tobytes(), dtype=np.int64, sep=" ")
+    del data
+    mapped.close()
+    if len(numbers) != count:
+        raise ValueError(f"invalid integer in bytes {start} to {stop} of {path}")
+    if _may_be_clamped(numbers):
+        raise OverflowError(f"integer beyond int64 in bytes {start} to {stop}")
+    out, out_handle = _attach_array(out_ref)
+    out[position : position + len(numbers)] = numbers
+    del out
+    out_handle.close()
+
+
+def read_numbers_parallel(
+    path: Union[str, Path], workers: int, start: int = 0
+) -> npt.NDArray[Any]:
+    """
+    path: file of whitespace separated numbers, from byte start on
+
+    The file is memory mapped and cut at whitespace into byte ranges that
+    workers parse in two passes: the first counts the tokens of every
+    range, which gives each range its offset in one shared int64 array,
+    and the second parses every range straight into its part of it
+
+    Returns: the numbers as read_numbers() gives them; rational ones, and
+    integers beyond int64, are parsed serially by it
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        if size <= start:
+            return np.zeros(0, dtype=np.int64)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if any(mapped.find(marker, start) != -1 for marker in RATIONAL_MARKERS):
+                return read_numbers(io.BytesIO(mapped[start:]))
+            # every cut is moved forward to the next whitespace
+            chunk_count = workers * CHUNKS_PER_WORKER
+            whitespace = re.compile(rb"\s")
+            cuts = [start]
+            for chunk in range(1, chunk_count):
+                cut = max(cuts[-1], start + (size - start) * chunk // chunk_count)
+                space = whitespace.search(mapped, cut)
+                cuts.append(space.start() if space else size)
+            cuts.append(size)
+    ranges = [(low, high) for low, high in zip(cuts, cuts[1:]) if low < high]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        counts = list(
+            pool.map(
+                _count_tokens,
+                itertools.repeat(path),
+                [low for low, _ in ranges],
+                [high for _, high in ranges],
+            )
+        )
+    positions = np.cumsum([0] + counts)
+
+    # workers started after the block exists share the resource tracker
+    # that unlinks it, instead of each reporting it as leaked
+    block = shared_memory.SharedMemory(create=True, size=max(8 * positions[-1], 1))
+    out: npt.NDArray[np.int64] = np.ndarray(
+        (positions[-1],), np.int64, buffer=block.buf
+    )
+    out_ref = ("shm", block.name, 0, out.shape, out.strides, out.dtype.str)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_parse_range, path, low, high, out_ref, position, count)
+                for (low, high), position, count in zip(
+                    ranges, positions.tolist(), counts
+                )
+                # np.fromstring reads a lone 0 from whitespace
+                if count
+            ]
+            for future in futures:
+                future.result()
+        numbers = out.copy()
+    except OverflowError:
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                numbers = read_numbers(io.BytesIO(mapped[start:]))
+    finally:
+        del out
+        block.close()
+        block.unlink()
+    return numbers
+
+
+def _find_psne_mask_in_block(
+    block: npt.NDArray[np.int64], maxima: Sequence[Optional[npt.NDArray[np.int64]]]
+) -> npt.NDArray[np.bool_]:
+    """
+    block: slab of the payoff matrix
+    maxima: per player, maxima matching the block, or None if the block
+    spans the player's whole axis and they can be taken inside the block
+
+    Returns: boolean matrix over the block's profiles, True at PSNE
+    """
+    is_psne = np.ones(block.shape[:-1], dtype=bool)
+    for pidx in range(block.ndim - 1):
+        our_payoffs = block[..., pidx]
+        axis_maxima = maxima[pidx]
+        if axis_maxima is None:
+            axis_maxima = our_payoffs.max(axis=pidx, keepdims=True)
+        is_psne &= our_payoffs == axis_maxima
+    return is_psne
+
+
+def _pack_best_responses_in_block(
+    block: npt.NDArray[np.int64], maxima: Sequence[Optional[npt.NDArray[np.int64]]]
+) -> npt.NDArray[np.uint8]:
+    """
+    block: slab of the payoff matrix along its last strategy axis
+    maxima: as for _find_psne_mask_in_block()
+
+    Only one player's boolean mask over the block exists at a time
+
+    Returns: per player, one bit per profile of the block in NFG order,
+    set where the player's strategy is a best response, packed by np.packbits
+    """
+    packed = []
+    for pidx in range(block.ndim - 1):
+        our_payoffs = block[..., pidx]
+        axis_maxima = maxima[pidx]
+        if axis_maxima is None:
+            axis_maxima = our_payoffs.max(axis=pidx, keepdims=True)
+        is_max = our_payoffs == axis_maxima
+        packed.append(np.packbits(is_max.reshape(-1, order="F")))
+    return np.stack(packed)
+
+
+# PSNE found in a slab as rows of strategies, and for every player whether
+# each of its strategies is a best response to all opponent profiles there
+BestResponses = Tuple[npt.NDArray[np.int64], List[npt.NDArray[np.bool_]]]
+
+
+def _find_best_responses_in_block(
+    block: npt.NDArray[np.int64], maxima: Sequence[Optional[npt.NDArray[np.int64]]]
+) -> BestResponses:
+    """
+    block: slab of the payoff matrix
+    maxima: per player, maxima over that player's whole axis, or None if the
+    block spans the whole axis and they can be taken inside the block
+
+    Every payoff is compared against its player's maximum once, and that
+    comparison feeds both the PSNE mask and the dominance flags
+
+    Returns: best responses with strategies local to the block
+    """
+    strategy_axes = range(block.ndim - 1)
+    is_psne = np.ones(block.shape[:-1], dtype=bool)
+    dominant: List[npt.NDArray[np.bool_]] = []
+    for pidx in strategy_axes:
+        our_payoffs = block[..., pidx]
+        axis_maxima = maxima[pidx]
+        if axis_maxima is None:
+            axis_maxima = our_payoffs.max(axis=pidx, keepdims=True)
+        is_max = our_payoffs == axis_maxima
+        is_psne &= is_max
+        other_axes = tuple(axis for axis in strategy_axes if axis != pidx)
+        dominant.append(is_max.all(axis=other_axes))
+    return np.argwhere(is_psne), dominant
+
+
+def _find_best_responses_in_slab(
+    payoffs_ref: ArrayRef, maxima_ref: ArrayRef, axis: int, start: int, stop: int
+) -> BestResponses:
+    """
+    Process pool task: best responses in one slab of a shared payoff matrix,
+    with PSNE given as strategies of the whole game
+    """
+    payoffs, payoffs_handle = _attach_array(payoffs_ref)
+    axis_maxima, maxima_handle = _attach_array(maxima_ref)
+    index: List[slice] = [slice(None)] * payoffs.ndim
+    index[axis] = slice(start, stop)
+    maxima: List[Optional[npt.NDArray[np.int64]]] = [None] * (payoffs.ndim - 1)
+    maxima[axis] = axis_maxima
+    psne_slab, dominant = _find_best_responses_in_block(payoffs[tuple(index)], maxima)
+    psne_slab[:, axis] += start
+
+    del payoffs, axis_maxima, maxima
+    for handle in (payoffs_handle, maxima_handle):
+        # shared memory blocks are closed, memory maps just dropped
+        if not isinstance(handle, np.memmap):
+            handle.close()
+    return psne_slab, dominant
+
+
+class SolveStats:
+    """
+    Wall time per phase and work counters of a solve
+
+    Every phase costs one pair of perf_counter calls and counters are
+    bumped once per block, so this stays on all the time
+    """
+
+    def __init__(self) -> None:
+        self.phase_seconds: Dict[str, float] = {}
+        self.profiles_visited = 0
+        self.bytes_allocated = 0
+        self.tensors: Dict[str, Dict[str, Any]] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + elapsed
+
+    def record_tensor(self, name: str, array: npt.NDArray[Any]) -> None:
+        self.tensors[name] = {
+            "shape": list(array.shape),
+            "dtype": str(array.dtype),
+            "bytes": int(array.nbytes),
+        }
+
+    def record_block(self, profile_count: int, bytes_allocated: int) -> None:
+        self.profiles_visited += int(profile_count)
+        self.bytes_allocated += int(bytes_allocated)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "phase_seconds": self.phase_seconds,
+            "profiles_visited": self.profiles_visited,
+            "bytes_allocated": self.bytes_allocated,
+            "tensors": self.tensors,
+        }
+
+
+Results = Tuple[List[List[int]], List[List[int]]]
+
+
+class BestResponseIndex:
+    """
+    One bit per profile and player, set where the player's strategy is a
+    best response to the others' strategies
+
+    Profiles are numbered in NFG order and every player's bits are packed
+    as np.packbits does, padded to whole 64-bit words, so PSNE are the set
+    bits of the AND of all players' words. At n bits per profile this is a
+    64th of n int64 comparisons, and checking a profile reads n bytes
+    """
+
+    def __init__(self, shape: Tuple[int, ...], masks: npt.NDArray[np.uint8]) -> None:
+        """
+        shape: strategy counts of the players
+        masks: packed bits of every player, of shape (players, 8 * words)
+        """
+        self.shape = tuple(shape)
+        self.masks = masks
+
+    @property
+    def nbytes(self) -> int:
+        return self.masks.nbytes
+
+    def is_psne(self, profile: Sequence[int]) -> bool:
+        """
+        profile: zero-indexed strategies
+        """
+        position = int(np.ravel_multi_index(tuple(profile), self.shape, order="F"))
+        bits = self.masks[:, position >> 3] & (0x80 >> (position & 7))
+        return bool(bits.all())
+
+    def find_psne(self) -> npt.NDArray[np.intp]:
+        """
+        Returns: zero-indexed PSNE as rows, in NFG order
+        """
+        if not len(self.masks):
+            return np.zeros((1, 0), dtype=np.intp)
+        words = np.bitwise_and.reduce(self.masks.view(np.uint64), axis=0)
+        nonzero = np.flatnonzero(words)
+        bits = np.unpackbits(words[nonzero].view(np.uint8).reshape(-1, 8), axis=1)
+        rows, columns = np.nonzero(bits)
+        positions = nonzero[rows] * 64 + columns
+        return np.stack(np.unravel_index(positions, self.shape, order="F"), axis=1)
+
+
+class ResultCache:
+    """
+    Content addressed store of solved games: an in-memory LRU of up to
+    max_entries results, optionally backed by a sqlite file at path that
+    outlives the process and is shared by every cache opened on it
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, path: Union[str, Path, None] = None
+    ) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Results]" = OrderedDict()
+        self._db: Optional["sqlite3.Connection"] = None
+        if path is not None:
+            import sqlite3
+
+            self._db = sqlite3.connect(str(path))
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results"
+                " (key TEXT PRIMARY KEY, psnes TEXT, vwdses TEXT)"
+            )
+
+    @staticmethod
+    def get_key(strategy_counts: List[int], payoffs: npt.NDArray[Any]) -> str:
+        """
+        Returns: digest of the strategy counts and the payoff tensor, whose
+        dtype and shape are hashed too so equal bytes of other games differ
+        """
+        import hashlib
+
+        digest = hashlib.blake2b(digest_size=20)
+        header = [list(map(int, strategy_counts)), str(payoffs.dtype), payoffs.shape]
+        digest.update(json.dumps(header).encode())
+        if payoffs.dtype == object:
+            # the buffer of an object array holds pointers, not values
+            digest.update(repr(payoffs.tolist()).encode())
+        else:
+            digest.update(np.ascontiguousarray(payoffs).data)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _copy(results: Results) -> Results:
+        """
+        Returns: results with fresh lists, so that callers mutating what
+        they put or got never change the cached entry
+        """
+        psnes, vwdses = results
+        return [list(psne) for psne in psnes], [list(vwdse) for vwdse in vwdses]
+
+    def _remember(self, key: str, results: Results) -> None:
+        self._entries[key] = results
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Results]:
+        """
+        Returns: PSNE and VWDSE stored under key, None on a miss
+        """
+        results = self._entries.get(key)
+        if results is None and self._db is not None:
+            row = self._db.execute(
+                "SELECT psnes, vwdses FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                results = (json.loads(row[0]), json.loads(row[1]))
+        if results is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(key, results)
+        return self._copy(results)
+
+    def put(self, key: str, results: Results) -> None:
+        self._remember(key, self._copy(results))
+        if self._db is not None:
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                    (key, json.dumps(results[0]), json.dumps(results[1])),
+                )
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
 class Game:
     def __init__(
         self,
         player_count: int = 0,
         strategy_counts: List[int] = [],
-        payoff_list: List[int] = [],
+        payoff_list: Sequence[int] = [],
         payoff_matrix: Optional[npt.NDArray[np.int64]] = None,
         optimize_single_strategy_counts: bool = True,
+        memory_budget: Optional[int] = None,
+        workers: int = 1,
+        eliminate_dominated_strategies: bool = False,
+        cache: Optional[ResultCache] = None,
+        symmetric: Optional[bool] = False,
     ) -> None:
-        self.player_count = player_count or int(input())
-        self.strategy_counts = strategy_counts or read_vec()
-        self.payoffs: npt.NDArray[np.int64] = (
-            payoff_matrix
-            if payoff_matrix is not None
-            else self._read_nfg_payoff(payoff_list or read_vec())
-        )
+        """
+        memory_budget: if given, maxima and PSNE are computed in blocks
+        along one strategy axis so that the working memory stays within
+        this many bytes, e.g. for payoff matrices from map_payoffs()
+        workers: number of processes checking slabs of the payoff matrix
+        for PSNE; the matrix is shared with them, never pickled
+        eliminate_dominated_strategies: search PSNE in the game left after
+        iterated elimination of strictly dominated strategies
+        cache: answers list_all_psne, list_all_vwdse and print_output from
+        earlier solves of the same game without touching the tensor
+        symmetric: True declares that every player has the same strategies
+        and payoffs do not change when players are permuted, None checks
+        that on payoffs; PSNE and VWDSE are then found from sorted profiles
+        only, C(n + s - 1, n) of them instead of s^n
+        """
+        self.stats = SolveStats()
+        self.payoff_scales: List[int] = []
+        with self.stats.phase("parse"):
+            if not player_count:
+                player_count, strategy_counts, payoff_list = read_game()
+            self.player_count = player_count
+            self.strategy_counts = strategy_counts or read_vec()
+            if payoff_matrix is None:
+                if payoff_list is None or len(payoff_list) == 0:
+                    payoff_list = read_vec()
+                payoff_matrix = self._read_nfg_payoff(payoff_list)
+            elif payoff_matrix.dtype.kind not in "biuf":
+                # rational tensors get the exact integer path too, floats
+                # compare exactly as they are, even when memory mapped
+                payoff_matrix, self.payoff_scales = scale_payoffs(
+                    payoff_matrix, len(self.strategy_counts)
+                )
+        self.payoff_scales = self.payoff_scales or [1] * len(self.strategy_counts)
+        self.payoffs: npt.NDArray[np.int64] = payoff_matrix
+        self.stats.record_tensor("input_payoffs", self.payoffs)
 
         self.optimize_single_strategy_counts = optimize_single_strategy_counts
 
@@ -38,108 +1109,738 @@ class Game:
             )
         )
         if self.optimize_single_strategy_counts:
-            self.payoffs = np.squeeze(self.payoffs)
-            mask_utilities = np.array(self.original_strategy_counts) != 1
-            self.payoffs = self.payoffs[..., mask_utilities]
-            self.player_count = len(self.payoffs.shape) - 1
+            with self.stats.phase("squeeze"):
+                mask_utilities = np.array(self.original_strategy_counts) != 1
+                # only strategy axes, a lone player's payoff axis must stay
+                single_axes = tuple(np.flatnonzero(~mask_utilities))
+                self.payoffs = np.squeeze(self.payoffs, axis=single_axes)
+                if not mask_utilities.all():
+                    self.payoffs = self.payoffs[..., mask_utilities]
+                self.player_count = len(self.payoffs.shape) - 1
+        self.stats.record_tensor("payoffs", self.payoffs)
 
-        self.maximum_values = self._find_axis_maxima()
+        if symmetric is None:
+            with self.stats.phase("symmetry"):
+                symmetric = is_symmetric(self.payoffs)
+        elif symmetric and len(set(self.payoffs.shape[:-1])) > 1:
+            raise ValueError("a symmetric game needs equal strategy counts")
+        self.symmetric = bool(symmetric) and self.player_count > 0
 
-    def _read_nfg_payoff(self, full_payoff_list: List[int]) -> npt.NDArray[np.int64]:
+        self.memory_budget = memory_budget if self.player_count else None
+        # Python integers beyond int64 cannot go to shared memory
+        self.workers = workers if self.player_count else 1
+        if self.payoffs.dtype == object:
+            self.workers = 1
+        self._maximum_values: Optional[List[npt.NDArray[np.int64]]] = None
+        self._best_response_index: Optional[BestResponseIndex] = None
+        self._regret: Optional[npt.NDArray[Any]] = None
+        self.regret_scale = 1
+        self.cache = cache
+
+        # kept up to date by update_payoffs() once it has been called
+        self._psne_set: Optional[Set[Tuple[int, ...]]] = None
+        self._best_response_counts: List[npt.NDArray[np.int64]] = []
+
+        # strictly dominated strategies never appear in a PSNE, but they do
+        # matter for VWDSE, so only the PSNE search runs on the reduced game,
+        # built by the first search that needs it
+        self.eliminate_dominated_strategies = (
+            eliminate_dominated_strategies and self.player_count > 0
+        )
+        self._reduced_game: Optional[Game] = None
+        self.reduced_strategies: List[npt.NDArray[np.intp]] = []
+
+    @classmethod
+    def from_nfg(
+        cls, path: Union[str, Path], sidecar: bool = True, **kwargs: Any
+    ) -> "Game":
         """
-        number_list: last line of NFG file containing payoffs
+        path: Gambit .nfg file, in the payoff or the outcome format
+        sidecar: keep the parsed payoffs in path.npy, keyed in path.json by
+        the file's mtime and size, and map them instead of parsing the file
+        again while it is unchanged
+        kwargs: passed on to Game
 
-        Returns: payoff matrix: with strategies indexed starting with zero
+        Returns: the game in path
         """
+        path = Path(path)
+        file_stat = path.stat()
+        key = {"mtime_ns": file_stat.st_mtime_ns, "size": file_stat.st_size}
+        npy_path = path.with_name(path.name + ".npy")
+        meta_path = path.with_name(path.name + ".json")
+
+        meta: Optional[Dict[str, Any]] = None
+        if sidecar and meta_path.exists() and npy_path.exists():
+            meta = json.loads(meta_path.read_text())
+            if meta.get("key") != key:
+                meta = None
+        if meta is not None:
+            strategy_counts = meta["strategy_counts"]
+            payoff_scales = meta["payoff_scales"]
+            payoffs = np.load(npy_path, mmap_mode="r")
+        else:
+            _, strategy_counts, payoffs = read_nfg(path)
+            payoff_scales = [1] * len(strategy_counts)
+            if payoffs.dtype.kind not in "biu":
+                payoffs, payoff_scales = scale_payoffs(payoffs, len(strategy_counts))
+            payoffs = compact_payoffs(payoffs)
+            # Python integers beyond int64 would need pickling
+            if sidecar and payoffs.dtype != object:
+                try:
+                    cls._write_nfg_sidecar(
+                        npy_path,
+                        meta_path,
+                        payoffs,
+                        key,
+                        strategy_counts,
+                        payoff_scales,
+                    )
+                except OSError:
+                    pass
 
-        payoffs_mat: npt.NDArray[np.int64] = np.zeros(
-            self.strategy_counts + [self.player_count], dtype=np.int64
+        game = cls(
+            len(strategy_counts),
+            strategy_counts,
+            [],
+            nfg_to_tensor(payoffs, strategy_counts),
+            **kwargs,
         )
-        current_strategies = [0 for _ in range(self.player_count)]
-        payoff_list_index = 0
+        game.payoff_scales = payoff_scales
+        return game
 
-        while True:
-            payoffs_to_assign = full_payoff_list[
-                payoff_list_index : payoff_list_index + self.player_count
-            ]
-            payoffs_mat[tuple(current_strategies)] = payoffs_to_assign
-            payoff_list_index += self.player_count
-            if self._increment(current_strategies):
-                break
+    @staticmethod
+    def _write_nfg_sidecar(
+        npy_path: Path,
+        meta_path: Path,
+        payoffs: npt.NDArray[Any],
+        key: Dict[str, int],
+        strategy_counts: List[int],
+        payoff_scales: List[int],
+    ) -> None:
+        # the key is written last, so a half written sidecar never matches
+        meta_path.unlink(missing_ok=True)
+        partial_path = npy_path.with_name(npy_path.name + ".partial")
+        with open(partial_path, "wb") as f:
+            np.save(f, payoffs)
+        os.replace(partial_path, npy_path)
+        meta = {
+            "key": key,
+            "strategy_counts": strategy_counts,
+            "payoff_scales": payoff_scales,
+        }
+        meta_path.write_text(json.dumps(meta))
+
+    @property
+    def reduced_game(self) -> Optional["Game"]:
+        """
+        Game left after eliminating dominated strategies, built on first
+        use so that solves answering VWDSE or from the cache do not pay for
+        it; None unless eliminate_dominated_strategies was asked for and
+        removed some strategy
+        """
+        if self._reduced_game is None and self.eliminate_dominated_strategies:
+            with self.stats.phase("eliminate"):
+                self._eliminate_dominated_strategies()
+            if self._reduced_game is not None:
+                self.stats.record_tensor("reduced_payoffs", self._reduced_game.payoffs)
+        return self._reduced_game
 
-        return payoffs_mat
+    def _eliminate_dominated_strategies(self) -> None:
+        """
+        Remove strictly dominated strategies of every player until none
+        are left, keeping the surviving strategy numbers of each player
+        in reduced_strategies and the smaller game in _reduced_game; when
+        nothing is dominated this game is searched as it is
+        """
+        payoffs = self.payoffs
+        strategies = [np.arange(count) for count in payoffs.shape[:-1]]
+
+        changed = True
+        while changed:
+            changed = False
+            for pidx in range(self.player_count):
+                count = payoffs.shape[pidx]
+                opponent_axes = tuple(
+                    axis for axis in range(self.player_count) if axis != pidx
+                )
+                # a dominator has a larger minimum and a larger maximum,
+                # and a strategy whose best payoff is below another's worst
+                # is dominated without comparing whole rows
+                minima = payoffs[..., pidx].min(axis=opponent_axes)
+                maxima = payoffs[..., pidx].max(axis=opponent_axes)
+                dominated = maxima < minima.max()
+                # one row per strategy, one column per opponent profile,
+                # copied only if some pair is left to compare
+                our_payoffs: Optional[npt.NDArray[Any]] = None
+                for strategy in range(count):
+                    # anything a dominated strategy beats is beaten by its
+                    # dominator as well, so it need not be tried
+                    if dominated[strategy]:
+                        continue
+                    candidates = np.flatnonzero(
+                        ~dominated
+                        & (minima < minima[strategy])
+                        & (maxima < maxima[strategy])
+                    )
+                    if candidates.size:
+                        if our_payoffs is None:
+                            our_payoffs = np.moveaxis(payoffs[..., pidx], pidx, 0)
+                            our_payoffs = our_payoffs.reshape(count, -1)
+                        beaten = our_payoffs[candidates] < our_payoffs[strategy]
+                        dominated[candidates[beaten.all(axis=1)]] = True
+                if dominated.any():
+                    payoffs = payoffs.compress(~dominated, axis=pidx)
+                    strategies[pidx] = strategies[pidx][~dominated]
+                    changed = True
+
+        if payoffs.shape == self.payoffs.shape:
+            self.eliminate_dominated_strategies = False
+            return
+        self.reduced_strategies = strategies
+        self._reduced_game = Game(
+            self.player_count,
+            list(payoffs.shape[:-1]),
+            [],
+            payoffs,
+            optimize_single_strategy_counts=False,
+            memory_budget=self.memory_budget,
+            workers=self.workers,
+        )
 
-    def _increment(self, strategy_list: List[int], idx: int = 0) -> bool:
+    @property
+    def maximum_values(self) -> Optional[List[npt.NDArray[np.int64]]]:
         """
-        Helper function for iteration over matrix values
+        Axis maxima of every player, found on first use so that searches
+        which never need all of them do not pay for them; None when a
+        memory budget rules out holding them
+        """
+        if self._maximum_values is None and self.memory_budget is None:
+            with self.stats.phase("maxima"):
+                self._maximum_values = self._find_axis_maxima()
+            maxima_bytes = sum(maxima.nbytes for maxima in self._maximum_values)
+            self.stats.record_block(0, maxima_bytes)
+        return self._maximum_values
 
-        Start by incrementing the first player's current strategy number
-        and then cascade/rollover into further players as necessary
-        Return True if all increments are exhausted by rolling over
+    def _read_nfg_payoff(
+        self, full_payoff_list: Sequence[Any]
+    ) -> npt.NDArray[np.int64]:
         """
-        if idx == self.player_count:
-            return True
-        strategy_list[idx] += 1
-        if strategy_list[idx] == self.strategy_counts[idx]:
-            strategy_list[idx] = 0
-            return self._increment(strategy_list, idx=(idx + 1))
-        return False
+        number_list: last line of NFG file containing payoffs, integers or
+        any rationals scale_payoffs() takes, scaled into payoff_scales
+
+        Returns: payoff matrix: with strategies indexed starting with zero,
+        stored in the narrowest integer dtype that holds every payoff
+        """
+        payoffs = np.asarray(full_payoff_list)
+        if payoffs.dtype.kind in "biu":
+            payoffs = payoffs.astype(np.int64)
+        else:
+            payoffs, self.payoff_scales = scale_payoffs(
+                payoffs, len(self.strategy_counts)
+            )
+        return nfg_to_tensor(compact_payoffs(payoffs), self.strategy_counts)
 
-    def _find_axis_maxima(self):
+    def _find_axis_maxima(self) -> List[npt.NDArray[np.int64]]:
         """
         Find the axis maxima values for payoffs
+
+        Returns: one array per player holding the best response payoff
+        against every profile of the other players; the player's own axis
+        is kept with length one so that it broadcasts against payoffs
         """
+        return [
+            self.payoffs[..., pidx].max(axis=pidx, keepdims=True)
+            for pidx in range(self.player_count)
+        ]
 
-        max_dimensions = [i + 1 for i in self.strategy_counts]
-        # matrix of dimension (s1 + 1, s2 + 1, ..., sn + 1)
-        # element at index s1 stores the maximum value for the first axis
-        # and so on...
-        axis_maxima = np.full(max_dimensions, -np.inf)
-        matrix_index = [0 for _ in range(self.player_count)]
-        while True:
-            value = self.payoffs[tuple(matrix_index)]
-            # we're arrived at a specific set of strategies
-            # preprocess to update its maximum values
-            for pidx in range(self.player_count):
-                old = matrix_index[pidx]
-                matrix_index[pidx] = self.strategy_counts[pidx]
-                indexing = tuple(matrix_index)
-                max_value = max(axis_maxima[indexing], value[pidx])
-                axis_maxima[indexing] = max_value
-                matrix_index[pidx] = old
-
-            if self._increment(matrix_index):
-                break
+    def _get_block_axis(self) -> int:
+        """
+        Strategy axis that is outermost in memory, so that blocks along it
+        are contiguous ranges of a memory mapped file
+        """
+        return int(np.argmax([abs(x) for x in self.payoffs.strides[:-1]]))
+
+    def _get_block_length(self, axis: int, memory_budget: int) -> int:
+        """
+        Number of strategies of axis per block that fit in memory_budget
+
+        Each profile in a block costs its payoffs, one maximum and two
+        boolean flags; the maxima of the player owning axis are kept for
+        the whole pass and are charged to the budget up front
+        """
+        slice_profiles = np.prod(self.payoffs.shape[:-1]) // self.payoffs.shape[axis]
+        itemsize = self.payoffs.itemsize
+        available = memory_budget - slice_profiles * itemsize
+        profile_bytes = (self.player_count + 1) * itemsize + 2
+        length = int(available // (slice_profiles * profile_bytes))
+        if length < 1:
+            raise ValueError(
+                f"memory budget of {memory_budget} bytes cannot hold "
+                f"a single slice of {slice_profiles} profiles"
+            )
+        return length
+
+    def _iter_blocks(
+        self, axis: int, length: int
+    ) -> Iterator[Tuple[int, npt.NDArray[np.int64]]]:
+        """
+        Split payoffs along axis into blocks of length strategies
+
+        Yields: (index of the first strategy in the block, block view)
+        """
+        index: List[slice] = [slice(None)] * (self.player_count + 1)
+        for start in range(0, self.payoffs.shape[axis], length):
+            index[axis] = slice(start, start + length)
+            yield start, self.payoffs[tuple(index)]
 
+    def _find_blocked_axis_maxima(self, axis: int) -> npt.NDArray[np.int64]:
+        """
+        Maxima of the player owning axis, one block at a time
+        """
+        assert self.memory_budget is not None
+        length = self._get_block_length(axis, self.memory_budget)
+        axis_maxima: Optional[npt.NDArray[np.int64]] = None
+        with self.stats.phase("maxima"):
+            for _, block in self._iter_blocks(axis, length):
+                block_maxima = block[..., axis].max(axis=axis, keepdims=True)
+                self.stats.record_block(block[..., 0].size, block_maxima.nbytes)
+                if axis_maxima is None:
+                    axis_maxima = block_maxima
+                else:
+                    np.maximum(axis_maxima, block_maxima, out=axis_maxima)
+        assert axis_maxima is not None
         return axis_maxima
 
-    def _get_all_psne(self):
-        matrix_index = [0 for _ in range(self.player_count)]
-        psne_list: List[List[int]] = []
+    def _find_best_responses_in_slabs(
+        self, axis: int, axis_maxima: npt.NDArray[np.int64]
+    ) -> List[BestResponses]:
+        """
+        Check slabs along axis on a pool of self.workers processes
+        """
+        from concurrent.futures import ProcessPoolExecutor
 
-        while True:
-            is_max = True
-            indexer = tuple(matrix_index)
-            for pidx in range(self.player_count):
-                my_utility = self.payoffs[indexer][pidx]
-                old = matrix_index[pidx]
-                matrix_index[pidx] = self.strategy_counts[pidx]
-                maximum_axis_utility = self.maximum_values[tuple(matrix_index)]
-                matrix_index[pidx] = old
+        axis_count = self.payoffs.shape[axis]
+        length = -(-axis_count // self.workers)
+        if self.memory_budget is not None:
+            worker_budget = self.memory_budget // self.workers
+            length = min(length, self._get_block_length(axis, worker_budget))
+
+        payoffs_ref, payoffs_block = _share_array(self.payoffs)
+        maxima_ref, maxima_block = _share_array(axis_maxima)
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [
+                    pool.submit(
+                        _find_best_responses_in_slab,
+                        payoffs_ref,
+                        maxima_ref,
+                        axis,
+                        start,
+                        start + length,
+                    )
+                    for start in range(0, axis_count, length)
+                ]
+                return [future.result() for future in futures]
+        finally:
+            for block in (payoffs_block, maxima_block):
+                if block is not None:
+                    block.close()
+                    block.unlink()
 
-                assert my_utility <= maximum_axis_utility
-                if my_utility < maximum_axis_utility:
-                    is_max = False
-                    break
+    def _find_best_responses_blocked(self) -> List[BestResponses]:
+        """
+        Best responses over slabs of payoffs: the maxima of the player owning
+        the slab axis are found first, then each slab is checked using
+        maxima of the other players computed inside the slab, either here
+        within the memory budget or on the worker pool
+        """
+        axis = self._get_block_axis()
+        if self.maximum_values is not None:
+            axis_maxima = self.maximum_values[axis]
+        else:
+            axis_maxima = self._find_blocked_axis_maxima(axis)
 
-            if is_max:
-                psne_list.append(deepcopy(matrix_index))
+        if self.workers > 1:
+            return self._find_best_responses_in_slabs(axis, axis_maxima)
 
-            if self._increment(matrix_index):
-                break
+        assert self.memory_budget is not None
+        maxima: List[Optional[npt.NDArray[np.int64]]] = [None] * self.player_count
+        maxima[axis] = axis_maxima
+        length = self._get_block_length(axis, self.memory_budget)
+        best_responses: List[BestResponses] = []
+        for start, block in self._iter_blocks(axis, length):
+            psne_block, dominant = _find_best_responses_in_block(block, maxima)
+            psne_block[:, axis] += start
+            best_responses.append((psne_block, dominant))
+        return best_responses
+
+    def _find_best_responses(self) -> Tuple[List[List[int]], List[List[int]]]:
+        """
+        Returns: PSNE in NFG order, VWDSE of every player
+        """
+        psne_array, vwdse_list = self._find_best_responses_array()
+        return psne_array.tolist(), vwdse_list
+
+    def _find_best_responses_array(
+        self,
+    ) -> Tuple[npt.NDArray[np.int64], List[List[int]]]:
+        """
+        One pass over payoffs giving both equilibrium concepts, since a
+        strategy is very weakly dominant iff it reaches its axis maximum
+        against every opponent profile
+
+        Returns: PSNE in NFG order as rows, VWDSE of every player
+        """
+        if self._psne_set is not None:
+            psne_list, vwdse_list = self._get_maintained_best_responses()
+            psne_array = np.array(psne_list, dtype=np.int64)
+            return psne_array.reshape(len(psne_list), self.player_count), vwdse_list
+        if self.symmetric:
+            with self.stats.phase("best_responses"):
+                return self._find_symmetric_best_responses()
+        if self.memory_budget is None and self.workers == 1:
+            maxima = self.maximum_values
+            with self.stats.phase("best_responses"):
+                best_responses = [_find_best_responses_in_block(self.payoffs, maxima)]
+            axis = 0
+        else:
+            axis = self._get_block_axis()
+            with self.stats.phase("best_responses"):
+                best_responses = self._find_best_responses_blocked()
+
+        # every profile gets compared once and flagged in two boolean masks
+        profile_count = np.prod(self.payoffs.shape[:-1])
+        self.stats.record_block(profile_count, 2 * profile_count)
+
+        # slabs split the dominance flags of the slab axis player, while the
+        # other players' flags cover every strategy in each slab
+        vwdse_list: List[List[int]] = []
+        for pidx in range(self.player_count):
+            slab_flags = [dominant[pidx] for _, dominant in best_responses]
+            if pidx == axis:
+                is_dominant = np.concatenate(slab_flags)
+            else:
+                is_dominant = np.logical_and.reduce(slab_flags)
+            vwdse_list.append(np.flatnonzero(is_dominant).tolist())
+
+        # back to NFG order, where the last player's strategy is the slowest key
+        psne_array = np.concatenate([psne for psne, _ in best_responses])
+        if self.player_count:
+            psne_array = psne_array[np.lexsort(psne_array.T)]
+        return psne_array, vwdse_list
 
+    def _find_symmetric_best_responses(
+        self,
+    ) -> Tuple[npt.NDArray[np.int64], List[List[int]]]:
+        """
+        All players share one payoff function of their own strategy and the
+        multiset of opponent strategies, so best responses are found once
+        per multiset and PSNE once per sorted profile, then permuted
+
+        Returns: PSNE in NFG order as rows, VWDSE of every player
+        """
+        count = self.payoffs.shape[0]
+        opponents = _get_sorted_profiles(count, self.player_count - 1)
+        # first player's payoffs, one column per opponent multiset by rank
+        table = np.empty((count, len(opponents)), dtype=self.payoffs.dtype)
+        index = (np.arange(count)[:, np.newaxis],) + tuple(opponents.T) + (0,)
+        table[:, _rank_multisets(opponents, count)] = self.payoffs[index]
+        is_best = table == table.max(axis=0)
+        dominant = np.flatnonzero(is_best.all(axis=1)).tolist()
+
+        profiles = _get_sorted_profiles(count, self.player_count)
+        is_psne = np.ones(len(profiles), dtype=bool)
+        for position in range(self.player_count):
+            others = np.delete(profiles, position, axis=1)
+            is_psne &= is_best[profiles[:, position], _rank_multisets(others, count)]
+        self.stats.record_block(len(profiles), table.nbytes + len(profiles))
+
+        # orbits of distinct sorted profiles are disjoint
+        permutations = itertools.chain.from_iterable(
+            map(_iter_distinct_permutations, profiles[is_psne].tolist())
+        )
+        psne_array = np.array(list(permutations), dtype=np.int64)
+        psne_array = psne_array.reshape(-1, self.player_count)
+        # NFG order, where the last player's strategy is the slowest key
+        psne_array = psne_array[np.lexsort(psne_array.T)]
+        return psne_array, [list(dominant) for _ in range(self.player_count)]
+
+    def _restore_reduced_strategies(
+        self, reduced_psne: List[List[int]]
+    ) -> List[List[int]]:
+        """
+        Map PSNE of the game left after eliminating dominated strategies
+        back to strategies of this game
+        """
+        reduced_array = np.array(reduced_psne, dtype=np.intp)
+        reduced_array = reduced_array.reshape(-1, self.player_count)
+        psne_list = [
+            strategies[reduced_array[:, pidx]]
+            for pidx, strategies in enumerate(self.reduced_strategies)
+        ]
+        return np.stack(psne_list, axis=1).tolist()
+
+    def _get_reduced_psne(self) -> List[List[int]]:
+        reduced_game = self.reduced_game
+        assert reduced_game is not None
+        return self._restore_reduced_strategies(reduced_game._get_all_psne())
+
+    def _get_all_psne(self):
+        if self.reduced_game is not None:
+            return self._expand_strategy_list(self._get_reduced_psne())
+        if self._best_response_index is not None and self._psne_set is None:
+            # ANDing the words of an index built before beats comparing payoffs
+            psne_array = self._best_response_index.find_psne()
+            return self._expand_strategy_list(psne_array.tolist())
+        psne_list, _ = self._find_best_responses()
         return self._expand_strategy_list(psne_list)
 
+    def _iter_maxima_blocks(
+        self, profile_multiple: int = 1
+    ) -> Iterator[
+        Tuple[int, npt.NDArray[np.int64], List[Optional[npt.NDArray[np.int64]]]]
+    ]:
+        """
+        Blocks along the last strategy axis, which is the slowest one in NFG
+        order, so that the blocks come out in that order too; all but the
+        last block hold a multiple of profile_multiple profiles
+
+        Yields: (index of the first strategy in the block, block, maxima
+        matching the block as _find_psne_mask_in_block() takes them)
+        """
+        axis = self.player_count - 1
+        slice_profiles = int(np.prod(self.payoffs.shape[:-2]))
+        if self._maximum_values is not None:
+            maxima: List[Optional[npt.NDArray[np.int64]]] = list(self._maximum_values)
+            length = max(1, STREAM_BLOCK_PROFILES // slice_profiles)
+        elif self.memory_budget is None:
+            # only the last axis spans blocks; the other players' maxima are
+            # taken inside each block, so searches stopping early skip them
+            maxima = [None] * self.player_count
+            maxima[axis] = self.payoffs[..., axis].max(axis=axis, keepdims=True)
+            length = max(1, STREAM_BLOCK_PROFILES // slice_profiles)
+        else:
+            assert self.memory_budget is not None
+            maxima = [None] * self.player_count
+            maxima[axis] = self._find_blocked_axis_maxima(axis)
+            length = self._get_block_length(axis, self.memory_budget)
+        step = profile_multiple // math.gcd(slice_profiles, profile_multiple)
+        length = max(step, length - length % step)
+
+        for start, block in self._iter_blocks(axis, length):
+            block_maxima = [
+                (
+                    axis_maxima[..., start : start + length]
+                    if axis_maxima is not None and pidx != axis
+                    else axis_maxima
+                )
+                for pidx, axis_maxima in enumerate(maxima)
+            ]
+            yield start, block, block_maxima
+
+    def _iter_psne_masks(self) -> Iterator[Tuple[int, npt.NDArray[np.bool_]]]:
+        """
+        Yields: (index of the first strategy in the block, PSNE mask)
+        """
+        if not self.player_count:
+            yield 0, np.ones((), dtype=bool)
+            return
+
+        for start, block, block_maxima in self._iter_maxima_blocks():
+            is_psne = _find_psne_mask_in_block(block, block_maxima)
+            self.stats.record_block(is_psne.size, 2 * is_psne.nbytes)
+            yield start, is_psne
+
+    @property
+    def best_response_index(self) -> BestResponseIndex:
+        """
+        Best response bits of every player and profile, built on first use
+        one block at a time, within the memory budget if there is one
+        """
+        if self._best_response_index is None:
+            with self.stats.phase("best_response_index"):
+                self._best_response_index = self._build_best_response_index()
+            self.stats.record_tensor(
+                "best_response_index", self._best_response_index.masks
+            )
+        return self._best_response_index
+
+    def _build_best_response_index(self) -> BestResponseIndex:
+        shape = self.payoffs.shape[:-1]
+        word_count = -(-int(np.prod(shape)) // 64)
+        masks = np.zeros((self.player_count, 8 * word_count), dtype=np.uint8)
+        if not self.player_count:
+            return BestResponseIndex(shape, masks)
+
+        # whole bytes per block, so that blocks pack independently
+        position = 0
+        for _, block, block_maxima in self._iter_maxima_blocks(8):
+            packed = _pack_best_responses_in_block(block, block_maxima)
+            byte = position // 8
+            masks[:, byte : byte + packed.shape[1]] = packed
+            profile_count = block[..., 0].size
+            position += profile_count
+            self.stats.record_block(profile_count, profile_count + packed.nbytes)
+        return BestResponseIndex(shape, masks)
+
+    @property
+    def regret(self) -> npt.NDArray[Any]:
+        """
+        For every profile, the most any player gains by deviating alone, in
+        units of 1 / regret_scale of the input payoffs; found on first use
+        one block at a time, and kept until payoffs are updated
+        """
+        if self._regret is None:
+            with self.stats.phase("regret"):
+                self._regret = self._find_regret()
+            self.stats.record_tensor("regret", self._regret)
+        return self._regret
+
+    def _find_regret(self) -> npt.NDArray[Any]:
+        """
+        Players' regrets are brought to the least common multiple of their
+        payoff scales before taking the maximum. With equal scales, the
+        regret of signed n-bit payoffs fits unsigned n bits, and is found
+        there exactly by wrapping subtraction
+
+        Returns: regret tensor in Fortran order like payoffs from NFG input,
+        so that regret.T.reshape(-1) lists it in NFG order without a copy
+        """
+        scales = [
+            scale
+            for scale, count in zip(self.payoff_scales, self.original_strategy_counts)
+            if count != 1 or not self.optimize_single_strategy_counts
+        ]
+        self.regret_scale = math.lcm(*scales)
+        factors = [self.regret_scale // scale for scale in scales]
+        if self.payoffs.dtype.kind not in "iu":
+            # float regret keeps the precision of float payoffs
+            dtype = self.payoffs.dtype
+        elif all(factor == 1 for factor in factors):
+            dtype = np.dtype(f"u{self.payoffs.itemsize}")
+        else:
+            spread = int(self.payoffs.max()) - int(self.payoffs.min())
+            wide = spread * max(factors) <= np.iinfo(np.int64).max
+            dtype = np.dtype(np.int64 if wide else object)
+
+        regret = np.zeros(self.payoffs.shape[:-1], dtype=dtype, order="F")
+        if not self.player_count:
+            return regret
+        axis = self.player_count - 1
+        for start, block, block_maxima in self._iter_maxima_blocks():
+            block_regret = regret[..., start : start + block.shape[axis]]
+            for pidx, (axis_maxima, factor) in enumerate(zip(block_maxima, factors)):
+                our_payoffs = block[..., pidx]
+                if axis_maxima is None:
+                    axis_maxima = our_payoffs.max(axis=pidx, keepdims=True)
+                if dtype.kind == "u":
+                    gap = axis_maxima.view(dtype) - our_payoffs.view(dtype)
+                else:
+                    gap = (
+                        axis_maxima.astype(dtype) - our_payoffs.astype(dtype)
+                    ) * factor
+                np.maximum(block_regret, gap, out=block_regret)
+            self.stats.record_block(block_regret.size, 2 * block_regret.nbytes)
+        return regret
+
+    def _to_input_units(self, regret: Any) -> Union[int, Fraction]:
+        """
+        Returns: a value of the regret tensor in the units of the input, as
+        an integer if it is a whole number
+        """
+        value = Fraction(regret) / self.regret_scale
+        return int(value) if value.denominator == 1 else value
+
+    def list_epsilon_psne(self, epsilon: Any) -> List[List[int]]:
+        """
+        epsilon: largest gain from deviating alone to accept, in the units
+        of the input payoffs, as any number _to_fraction() takes
+
+        Returns: profiles no player can improve on by more than epsilon,
+        one-indexed and in NFG order, so epsilon 0 gives list_all_psne()
+        """
+        regret = self.regret
+        bound = _to_fraction(epsilon) * self.regret_scale
+        if bound < 0:
+            return []
+        if regret.dtype.kind in "iu":
+            # integer regrets are within epsilon iff within its floor
+            bound = math.floor(bound)
+        elif regret.dtype.kind == "f":
+            bound = float(bound)
+        profiles = np.argwhere((regret <= bound).T)[:, ::-1]
+        return self._get_human_readable_strategy_list(
+            self._expand_strategy_list(profiles.tolist())
+        )
+
+    def top_k_min_regret(self, k: int) -> List[Tuple[List[int], Union[int, Fraction]]]:
+        """
+        The k-th smallest regret is found by partial selection with
+        np.argpartition, the profiles below it taken in one pass, and ties
+        at it broken in NFG order, so no more than k profiles are sorted
+
+        Returns: up to k one-indexed profiles of least regret with their
+        regret in the units of the input payoffs, by regret then NFG order
+        """
+        regret = self.regret
+        flat = regret.T.reshape(-1)
+        k = min(k, flat.size)
+        if k <= 0:
+            return []
+        kth = flat[np.argpartition(flat, k - 1)[k - 1]]
+        below = np.flatnonzero(flat < kth)
+        ties = np.flatnonzero(flat == kth)[: k - len(below)]
+        positions = np.concatenate([below, ties])
+        positions = positions[np.argsort(flat[positions], kind="stable")]
+        if self.player_count:
+            columns = np.unravel_index(positions, regret.shape, order="F")
+            profiles = np.stack(columns, axis=1).tolist()
+        else:
+            profiles = [[] for _ in positions]
+        profiles = self._get_human_readable_strategy_list(
+            self._expand_strategy_list(profiles)
+        )
+        regrets = [self._to_input_units(value) for value in flat[positions].tolist()]
+        return list(zip(profiles, regrets))
+
+    def is_psne(self, profile: Sequence[int]) -> bool:
+        """
+        profile: one-indexed strategies of every player, as list_all_psne
+        gives them
+
+        Reads one bit per player from best_response_index, or looks the
+        profile up among the PSNE kept by update_payoffs()
+        """
+        if len(profile) != len(self.original_strategy_counts) or not all(
+            1 <= strategy <= count
+            for strategy, count in zip(profile, self.original_strategy_counts)
+        ):
+            raise ValueError(f"invalid profile {profile}")
+        indices = tuple(
+            strategy - 1
+            for strategy, count in zip(profile, self.original_strategy_counts)
+            if count != 1 or not self.optimize_single_strategy_counts
+        )
+        if self._psne_set is not None:
+            return indices in self._psne_set
+        return self.best_response_index.is_psne(indices)
+
+    def _iter_psne_blocks(self) -> Iterator[List[List[int]]]:
+        """
+        Yields: PSNE of successive blocks of profiles, in NFG order
+        """
+        reduced_game = self.reduced_game
+        if reduced_game is not None:
+            for reduced_psne in reduced_game._iter_psne_blocks():
+                yield self._restore_reduced_strategies(reduced_psne)
+            return
+
+        for start, is_psne in self._iter_psne_masks():
+            psne_block = np.argwhere(is_psne.T)[:, ::-1]
+            if self.player_count:
+                psne_block[:, -1] += start
+            yield psne_block.tolist()
+
     def _expand_vwds_list(self, vwds_list: List[List[int]]):
         if not self.optimize_single_strategy_counts:
             return vwds_list
@@ -178,58 +1879,503 @@ class Game:
         """
         return [[x + 1 for x in y] for y in strategy_list]
 
+    def _solve(self) -> Results:
+        """
+        Returns: one-indexed PSNE and VWDSE, taken from the cache if the
+        game was solved before
+        """
+        key = None
+        if self.cache is not None:
+            with self.stats.phase("cache"):
+                key = self.cache.get_key(self.original_strategy_counts, self.payoffs)
+                cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        # the VWDSE need the full game, and the pass finding them finds its
+        # PSNE too, which strict dominance elimination would leave unchanged
+        psne_list, vwdse_list = self._find_best_responses()
+        results = (
+            self._get_human_readable_strategy_list(
+                self._expand_strategy_list(psne_list)
+            ),
+            self._get_human_readable_strategy_list(self._expand_vwds_list(vwdse_list)),
+        )
+        if self.cache is not None:
+            assert key is not None
+            self.cache.put(key, results)
+        return results
+
     def list_all_psne(self):
+        if self.cache is not None:
+            return self._solve()[0]
         psne_list = self._get_all_psne()
         return self._get_human_readable_strategy_list(psne_list)
 
+    def iter_psne(self) -> Iterator[List[int]]:
+        """
+        Lazily yield the PSNE of list_all_psne in the same order, checking
+        one block of profiles at a time
+        """
+        for psne_block in self._iter_psne_blocks():
+            yield from self._get_human_readable_strategy_list(
+                self._expand_strategy_list(psne_block)
+            )
+
+    def has_psne(self) -> bool:
+        return next(self.iter_psne(), None) is not None
+
+    def first_psne(self, k: int) -> List[List[int]]:
+        return list(itertools.islice(self.iter_psne(), k))
+
+    def count_psne(self) -> int:
+        reduced_game = self.reduced_game
+        if reduced_game is not None:
+            return reduced_game.count_psne()
+        return sum(int(is_psne.sum()) for _, is_psne in self._iter_psne_masks())
+
+    def find_psne_by_best_response(
+        self,
+        max_steps: int = 100000,
+        restarts: int = 10,
+        better_response: bool = False,
+        seed: Optional[int] = None,
+    ) -> Optional[List[int]]:
+        """
+        Heuristic search for a single PSNE without enumerating profiles
+
+        From a random profile, players take turns switching to a best
+        response (or a random better response), read off one fiber of
+        payoffs at a time. Revisiting a profile means the dynamics cycle,
+        and the search restarts from a new random profile. Potential games
+        such as congestion games always converge.
+
+        Returns: a PSNE as in list_all_psne, or None after giving up when
+        every restart cycled or max_steps switches were made in total
+        """
+        rng = np.random.default_rng(seed)
+        steps = 0
+        for _ in range(restarts + 1):
+            profile = [int(rng.integers(count)) for count in self.payoffs.shape[:-1]]
+            visited = {tuple(profile)}
+            stable_players = 0
+            pidx = 0
+            while stable_players < self.player_count:
+                index: List[Any] = list(profile)
+                index[pidx] = slice(None)
+                our_payoffs = self.payoffs[tuple(index + [pidx])]
+                self.stats.record_block(len(our_payoffs), 0)
+                current = our_payoffs[profile[pidx]]
+                if better_response:
+                    better = np.flatnonzero(our_payoffs > current)
+                    strategy = int(rng.choice(better)) if len(better) else None
+                else:
+                    best = int(our_payoffs.argmax())
+                    strategy = best if our_payoffs[best] > current else None
+
+                if strategy is None:
+                    stable_players += 1
+                else:
+                    profile[pidx] = strategy
+                    # a better response need not be a best response yet
+                    stable_players = 0 if better_response else 1
+                    steps += 1
+                    if steps >= max_steps:
+                        return None
+                    if tuple(profile) in visited:
+                        break
+                    visited.add(tuple(profile))
+                pidx = (pidx + 1) % self.player_count
+            else:
+                return self._get_human_readable_strategy_list(
+                    self._expand_strategy_list([profile])
+                )[0]
+        return None
+
+    def _build_maintained_best_responses(self) -> None:
+        """
+        Find the PSNE set and, for every strategy, against how many
+        opponent profiles it is a best response; a strategy is very weakly
+        dominant iff that is all of them
+        """
+        if self.memory_budget is not None:
+            raise ValueError("payoff updates need the axis maxima in memory")
+        # own the tensor so that updates never write through to the caller
+        # or to a mapped sidecar file
+        self.payoffs = np.array(self.payoffs)
+        psne_list, _ = self._find_best_responses()
+        maxima = self.maximum_values
+        assert maxima is not None
+        self._best_response_counts = []
+        for pidx in range(self.player_count):
+            is_best = self.payoffs[..., pidx] == maxima[pidx]
+            other_axes = tuple(
+                axis for axis in range(self.player_count) if axis != pidx
+            )
+            self._best_response_counts.append(is_best.sum(axis=other_axes))
+        self._psne_set = set(map(tuple, psne_list))
+
+    def _get_maintained_best_responses(self) -> Tuple[List[List[int]], List[List[int]]]:
+        assert self._psne_set is not None
+        profile_count = int(np.prod(self.payoffs.shape[:-1]))
+        vwdse_list = [
+            np.flatnonzero(counts * count == profile_count).tolist()
+            for counts, count in zip(self._best_response_counts, self.payoffs.shape)
+        ]
+        # NFG order, where the last player's strategy is the slowest key
+        psne_list = sorted(self._psne_set, key=lambda profile: profile[::-1])
+        return list(map(list, psne_list)), vwdse_list
+
+    def _update_profile(
+        self, profile: Tuple[int, ...], values: npt.NDArray[np.int64]
+    ) -> None:
+        """
+        Write the payoffs of one zero-indexed profile, then refresh the
+        players' fibers through it: their maxima, best response counts and
+        the PSNE status of the profiles on them, which are the only ones
+        whose status can change
+        """
+        assert self._psne_set is not None and self._maximum_values is not None
+        maxima = self._maximum_values
+        fibers: List[Tuple[Any, ...]] = []
+        old_best: List[npt.NDArray[np.bool_]] = []
+        for pidx in range(self.player_count):
+            fiber = profile[:pidx] + (slice(None),) + profile[pidx + 1 :]
+            maxima_index = profile[:pidx] + (0,) + profile[pidx + 1 :]
+            fibers.append(fiber)
+            old_best.append(self.payoffs[fiber + (pidx,)] == maxima[pidx][maxima_index])
+
+        self.payoffs[profile] = values
+        for pidx, fiber in enumerate(fibers):
+            our_payoffs = self.payoffs[fiber + (pidx,)]
+            maxima_index = profile[:pidx] + (0,) + profile[pidx + 1 :]
+            maxima[pidx][maxima_index] = our_payoffs.max()
+            is_best = our_payoffs == maxima[pidx][maxima_index]
+            self._best_response_counts[pidx] += (
+                is_best.astype(np.int64) - old_best[pidx]
+            )
+
+        for pidx, fiber in enumerate(fibers):
+            # every player's best response condition along this fiber
+            is_psne = np.ones(self.payoffs.shape[pidx], dtype=bool)
+            for other in range(self.player_count):
+                maxima_index = fiber[:other] + (0,) + fiber[other + 1 :]
+                is_psne &= self.payoffs[fiber + (other,)] == maxima[other][maxima_index]
+            for strategy in range(self.payoffs.shape[pidx]):
+                fiber_profile = profile[:pidx] + (strategy,) + profile[pidx + 1 :]
+                if is_psne[strategy]:
+                    self._psne_set.add(fiber_profile)
+                else:
+                    self._psne_set.discard(fiber_profile)
+            self.stats.record_block(len(is_psne), 0)
+
+    def update_payoffs(
+        self,
+        profiles: Sequence[Sequence[int]],
+        values: Union[Sequence[Sequence[int]], npt.NDArray[np.int64]],
+    ) -> None:
+        """
+        profiles: one-indexed strategy profiles, as list_all_psne gives them
+        values: new payoffs of every player at each of those profiles
+
+        Updates the axis maxima, PSNE and VWDSE at a cost proportional to
+        the fibers through the changed profiles rather than the game size.
+        The first call copies the payoffs and finds the state kept up to
+        date from then on, and drops the reduced game, which it outdates
+        """
+        profile_array = np.array(profiles, dtype=np.int64).reshape(len(profiles), -1)
+        value_array = np.array(values, dtype=object).reshape(len(profiles), -1)
+        original_player_count = len(self.original_strategy_counts)
+        if profile_array.shape[1] != original_player_count:
+            raise ValueError(f"profiles need {original_player_count} strategies")
+        if value_array.shape[1] != original_player_count:
+            raise ValueError(f"values need {original_player_count} payoffs")
+        if (
+            (profile_array < 1) | (profile_array > self.original_strategy_counts)
+        ).any():
+            raise ValueError("strategies must be between 1 and their strategy count")
+        # new payoffs are in the units of the input, like the old ones
+        value_array = np.vectorize(_to_fraction, otypes=[object])(value_array)
+        if self.payoffs.dtype.kind == "f":
+            # float payoffs take the nearest float, as given ones did
+            value_array = value_array.astype(self.payoffs.dtype)
+        else:
+            value_array = value_array * np.array(self.payoff_scales, dtype=object)
+            if any(value.denominator != 1 for value in value_array.flat):
+                raise ValueError("values must be multiples of 1 / payoff_scales")
+            value_array = np.vectorize(lambda value: value.numerator, otypes=[object])(
+                value_array
+            )
+        if not self.player_count:
+            return
+        self._best_response_index = None
+        self._regret = None
+
+        if self.optimize_single_strategy_counts:
+            kept = np.array(self.original_strategy_counts) != 1
+            profile_array = profile_array[:, kept]
+            value_array = value_array[:, kept]
+        profile_array -= 1
+
+        if self._psne_set is None:
+            # updates may break symmetry, and outdate the reduced game
+            self.symmetric = False
+            self.eliminate_dominated_strategies = False
+            self._reduced_game = None
+            self.reduced_strategies = []
+            self._build_maintained_best_responses()
+        assert self._maximum_values is not None
+        if self.payoffs.dtype.kind in "iu" and value_array.size:
+            low, high = value_array.min(), value_array.max()
+            info = np.iinfo(self.payoffs.dtype)
+            if low < info.min or high > info.max:
+                wide = np.iinfo(np.int64)
+                dtype = np.int64 if wide.min <= low and high <= wide.max else object
+                self.payoffs = self.payoffs.astype(dtype)
+                self._maximum_values = [
+                    maxima.astype(dtype) for maxima in self._maximum_values
+                ]
+
+        with self.stats.phase("update"):
+            for profile, profile_values in zip(profile_array.tolist(), value_array):
+                self._update_profile(tuple(profile), profile_values)
+
     def _get_all_vwdse(self):
-        vwdse_strategies: List[List[int]] = []
-        for player in range(self.player_count):
-            our_payoffs = self.payoffs[..., player]
-            prev_best = None
-
-            for strategy in range(self.strategy_counts[player]):
-                str_payoffs = our_payoffs.take(strategy, axis=player)
-                if prev_best is None or (str_payoffs >= prev_best).all():
-                    prev_best = str_payoffs
-
-            # make type checker happy
-            assert prev_best is not None
-
-            # ensure prev_best is better than other strategies
-            for strategy in range(self.strategy_counts[player]):
-                str_payoffs = our_payoffs.take(strategy, axis=player)
-                if not (prev_best >= str_payoffs).all():
-                    # vwds not possible
-                    # make prev_best inf so that any strat cant be found in next step
-                    prev_best = np.full(str_payoffs.shape, np.inf)
-                    break
-
-            my_vwdse_strategies: List[int] = []
-            for strategy in range(self.strategy_counts[player]):
-                str_payoffs = our_payoffs.take(strategy, axis=player)
-                if (str_payoffs >= prev_best).all():
-                    my_vwdse_strategies.append(strategy)
-
-            vwdse_strategies.append(my_vwdse_strategies)
-
-        return self._expand_vwds_list(vwdse_strategies)
+        _, vwdse_list = self._find_best_responses()
+        return self._expand_vwds_list(vwdse_list)
 
     def list_all_vwdse(self):
+        if self.cache is not None:
+            return self._solve()[1]
         vwdse = self._get_all_vwdse()
         return self._get_human_readable_strategy_list(vwdse)
 
-    def print_output(self):
-        psnes = self.list_all_psne()
-        vwdses = self.list_all_vwdse()
+    @staticmethod
+    def solve_batch(
+        player_count: int,
+        strategy_counts: List[int],
+        payoff_stack: npt.NDArray[np.int64],
+    ) -> List[Tuple[List[List[int]], List[List[int]]]]:
+        """
+        payoff_stack: payoff matrices of same shaped games stacked along a
+        new first axis
+
+        Solves every game in one vectorized pass; players with a single
+        strategy are simply axes of length one here
+
+        Returns: (PSNE, VWDSE) of every game, as from list_all_psne and
+        list_all_vwdse
+        """
+        payoff_stack = np.asarray(payoff_stack)
+        if not len(payoff_stack):
+            return []
+        strategy_axes = range(1, player_count + 1)
+        is_psne = np.ones(payoff_stack.shape[:-1], dtype=bool)
+        dominant: List[npt.NDArray[np.bool_]] = []
+        for axis in strategy_axes:
+            our_payoffs = payoff_stack[..., axis - 1]
+            is_max = our_payoffs == our_payoffs.max(axis=axis, keepdims=True)
+            is_psne &= is_max
+            other_axes = tuple(other for other in strategy_axes if other != axis)
+            dominant.append(is_max.all(axis=other_axes))
+
+        # sort by game, then in NFG order within each game
+        psne_array = np.argwhere(is_psne)
+        psne_array = psne_array[np.lexsort(np.roll(psne_array, -1, axis=1).T)]
+        game_starts = np.searchsorted(psne_array[:, 0], range(len(payoff_stack)))
+        psne_lists = np.split(psne_array[:, 1:] + 1, game_starts[1:])
+
+        results: List[Tuple[List[List[int]], List[List[int]]]] = []
+        for game, psne_list in enumerate(psne_lists):
+            vwdse_list = [
+                (np.flatnonzero(is_dominant[game]) + 1).tolist()
+                for is_dominant in dominant
+            ]
+            results.append((psne_list.tolist(), vwdse_list))
+        return results
+
+    @staticmethod
+    def _print_results(
+        psnes: Union[List[List[int]], npt.NDArray[np.int64]],
+        vwdses: List[List[int]],
+        file: Optional[TextIO] = None,
+        psne_rows: bool = True,
+    ) -> None:
+        """
+        psnes: one-indexed PSNE, as lists or rows of an array
+        psne_rows: False prints the PSNE count only
+
+        Writes the lines one print() per line would, a block at a time
+        """
+        if file is None:
+            file = sys.stdout
+        psne_array = np.asarray(psnes, dtype=np.int64).reshape(len(psnes), len(vwdses))
+        file.write(f"{len(psne_array)}\n")
+        if psne_rows:
+            for lines in _iter_psne_lines(psne_array):
+                file.write(lines)
+        file.write(
+            "".join(f"{len(vwdse)} {' '.join(map(str, vwdse))}\n" for vwdse in vwdses)
+        )
+
+    def _solve_array(self) -> Tuple[npt.NDArray[np.int64], List[List[int]]]:
+        """
+        Returns: what _solve() does, with the PSNE as rows of an array that
+        is never turned into lists unless the cache needs them
+        """
+        if self.cache is not None:
+            psnes, vwdses = self._solve()
+            psne_array = np.array(psnes, dtype=np.int64)
+            return psne_array.reshape(len(psnes), len(vwdses)), vwdses
+
+        # PSNE of the full pass, as in _solve()
+        psne_array, vwdse_list = self._find_best_responses_array()
+        if self.optimize_single_strategy_counts:
+            kept = np.array(self.original_strategy_counts) != 1
+            expanded = np.zeros((len(psne_array), len(kept)), dtype=np.int64)
+            expanded[:, kept] = psne_array
+            psne_array = expanded
+        vwdses = self._get_human_readable_strategy_list(
+            self._expand_vwds_list(vwdse_list)
+        )
+        return psne_array + 1, vwdses
+
+    def get_psne_array(self) -> npt.NDArray[np.int64]:
+        """
+        Returns: list_all_psne() as rows of an array
+        """
+        return self._solve_array()[0]
+
+    def print_output(
+        self,
+        file: Optional[TextIO] = None,
+        psne_file: Union[str, Path, BinaryIO, None] = None,
+    ):
+        """
+        file: text stream to print to, defaults to sys.stdout
+        psne_file: if given, the PSNE are saved there by save_psne_array()
+        and only their count is printed
+        """
+        psnes, vwdses = self._solve_array()
+        with self.stats.phase("output"):
+            if psne_file is not None:
+                save_psne_array(psnes, psne_file)
+            self._print_results(psnes, vwdses, file, psne_rows=psne_file is None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns: stats of this game, and of the reduced game searched for
+        PSNE if dominated strategies were eliminated
+        """
+        stats = self.stats.to_dict()
+        if self.cache is not None:
+            stats["cache"] = self.cache.to_dict()
+        if self._reduced_game is not None:
+            stats["reduced_game"] = self._reduced_game.get_stats()
+        return stats
+
 
-        print(len(psnes))
-        for psne in psnes:
-            print(" ".join(map(str, psne)))
-        for vwdse in vwdses:
-            print(len(vwdse), " ".join(map(str, vwdse)))
+def print_batch_output(
+    source: Union[str, Path, BinaryIO, None] = None,
+    stats: Optional[SolveStats] = None,
+) -> None:
+    """
+    source: any number of games in the stdin layout, one after another
+    stats: if given, collects timings and counters of the whole stream
+
+    Runs of consecutive games with the same shape are solved together with
+    Game.solve_batch, and results are printed per game as by print_output
+    """
+    stats = stats or SolveStats()
+    with stats.phase("parse"):
+        numbers = read_numbers(source)
+    position = 0
+    while position < len(numbers):
+        player_count = int(numbers[position])
+        shape = numbers[position : position + player_count + 1]
+        strategy_counts = [int(count) for count in shape[1:]]
+        game_size = player_count + 1 + player_count * int(np.prod(strategy_counts))
+
+        # gather the run of games sharing this header
+        starts = [position]
+        position += game_size
+        while position + game_size <= len(numbers) and np.array_equal(
+            numbers[position : position + player_count + 1], shape
+        ):
+            starts.append(position)
+            position += game_size
+
+        with stats.phase("parse"):
+            payoff_stack = np.stack(
+                [
+                    numbers[start + player_count + 1 : start + game_size]
+                    for start in starts
+                ]
+            )
+            if payoff_stack.dtype.kind not in "biu":
+                payoff_stack, _ = scale_payoffs(payoff_stack, player_count)
+            payoff_stack = nfg_to_tensor(compact_payoffs(payoff_stack), strategy_counts)
+        with stats.phase("best_responses"):
+            results = Game.solve_batch(player_count, strategy_counts, payoff_stack)
+        profile_count = payoff_stack[..., 0].size
+        stats.record_block(profile_count, 2 * profile_count)
+        with stats.phase("output"):
+            for psnes, vwdses in results:
+                Game._print_results(psnes, vwdses)
 
 
 if __name__ == "__main__":
-    g = Game()
-    g.print_output()
+    parser = argparse.ArgumentParser(
+        description="Print the PSNE and VWDSE of a game read from stdin"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="read any number of games from stdin and print results per game",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="write phase timings and counters to stderr as JSON",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="parse the payoffs with N processes when stdin is a regular file",
+    )
+    parser.add_argument(
+        "--psne-file",
+        metavar="PATH",
+        help="save the PSNE to PATH as int32 rows, .npy if it ends in .npy and"
+        " raw otherwise, and print only their count",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="sqlite file of results reused across runs on the same game,"
+        " not used with --batch",
+    )
+    args = parser.parse_args()
+
+    if args.batch:
+        stream_stats = SolveStats()
+        print_batch_output(stats=stream_stats)
+        stats = stream_stats.to_dict()
+    else:
+        cache = ResultCache(path=args.cache) if args.cache else None
+        stdin_path = _get_stdin_path() if args.parse_workers > 1 else None
+        if stdin_path is not None:
+            g = Game(*read_game(stdin_path, args.parse_workers), cache=cache)
+        else:
+            g = Game(cache=cache)
+        g.print_output(psne_file=args.psne_file)
+        stats = g.get_stats()
+        if cache is not None:
+            cache.close()
+
+    if args.profile:
+        sys.stdout.flush()
+        json.dump(stats, sys.stderr)
+        sys.stderr.write("\n")
@@ -0,0 +1,268 @@
+"""
+Long running solver: games in the stdin layout of q1.py come in over stdin
+or a Unix socket and every game is answered with the output print_output
+gives for it, so interpreter and NumPy startup are paid once per server
+instead of once per game
+
+Usage:
+    python src/server.py [--workers 4]                 # stdin to stdout
+    python src/server.py --socket /tmp/q1.sock [...]   # one stream per client
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, BinaryIO, Callable, List, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from q1 import Game, read_numbers
+
+GameInput = Tuple[int, List[int], npt.NDArray[Any]]
+
+
+class GameFramer:
+    """
+    Splits a stream of whitespace separated numbers into games in the
+    stdin layout, however the games are broken into lines; payoffs may be
+    rational as read_numbers() parses them
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[npt.NDArray[Any]] = []
+        self._size = 0
+        self._needed = 1
+
+    @staticmethod
+    def _to_count(number: Any) -> int:
+        """
+        number: an int64, or a bytes token if its line held rationals
+        """
+        count = int(number)
+        # an empty game has no tensor to solve
+        if count < 1:
+            raise ValueError(f"invalid player or strategy count {number}")
+        return count
+
+    @classmethod
+    def _get_game_size(cls, numbers: npt.NDArray[Any]) -> int:
+        """
+        Returns: number of numbers in the game at the start of numbers, or
+        a lower bound of it while its strategy counts are incomplete
+        """
+        player_count = cls._to_count(numbers[0])
+        if numbers.size < player_count + 1:
+            return player_count + 1
+        strategy_counts = [
+            cls._to_count(count) for count in numbers[1 : player_count + 1]
+        ]
+        return player_count + 1 + player_count * int(np.prod(strategy_counts))
+
+    def feed(self, data: bytes) -> List[GameInput]:
+        """
+        data: whole lines of input
+
+        Returns: the games completed by data
+
+        Raises ValueError for a token that is not a number or a count that
+        is not a positive integer; blank lines hold no numbers and are
+        skipped
+        """
+        numbers = read_numbers(io.BytesIO(data))
+        if not numbers.size:
+            return []
+        self._chunks.append(numbers)
+        self._size += numbers.size
+        if any(chunk.dtype.kind == "S" for chunk in self._chunks):
+            # integers join the tokens of rational lines as tokens
+            self._chunks = [chunk.astype(np.bytes_) for chunk in self._chunks]
+        games: List[GameInput] = []
+        while self._size >= self._needed:
+            numbers = np.concatenate(self._chunks)
+            needed = self._get_game_size(numbers)
+            if numbers.size < needed:
+                self._chunks = [numbers]
+                self._needed = needed
+                break
+            player_count = self._to_count(numbers[0])
+            strategy_counts = [
+                self._to_count(count) for count in numbers[1 : player_count + 1]
+            ]
+            games.append(
+                (player_count, strategy_counts, numbers[player_count + 1 : needed])
+            )
+            self._chunks = [numbers[needed:]]
+            self._size -= needed
+            self._needed = 1
+        return games
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+
+def solve(
+    player_count: int, strategy_counts: List[int], payoff_list: npt.NDArray[Any]
+) -> bytes:
+    """
+    Returns: what print_output prints for the game
+    """
+    output = io.StringIO()
+    Game(player_count, strategy_counts, payoff_list).print_output(output)
+    return output.getvalue().encode()
+
+
+def read_response(stream: BinaryIO, player_count: int) -> bytes:
+    """
+    Client side framing: reads one answer for a game of player_count
+    players, which is a PSNE count line, that many PSNE and a VWDSE line
+    per player
+
+    Returns: the answer, empty if the server closed the stream
+    """
+    first = stream.readline()
+    if not first:
+        return first
+    lines = [first]
+    for _ in range(int(first) + player_count):
+        lines.append(stream.readline())
+    return b"".join(lines)
+
+
+async def answer_stream(
+    readline: Callable[[], Awaitable[bytes]],
+    write: Callable[[bytes], Awaitable[None]],
+    executor: Executor,
+    max_pending: int,
+) -> None:
+    """
+    Solve every game read from one stream on executor and write the answers
+    in input order, with up to max_pending games in flight at a time
+
+    An invalid game ends the stream, after the answers before it
+    """
+    loop = asyncio.get_running_loop()
+    pending: "asyncio.Queue[Optional[asyncio.Future[bytes]]]" = asyncio.Queue(
+        max_pending
+    )
+
+    async def write_answers() -> None:
+        while True:
+            answer = await pending.get()
+            if answer is None:
+                return
+            await write(await answer)
+
+    writing = asyncio.create_task(write_answers())
+    framer = GameFramer()
+    try:
+        while not writing.done():
+            line = await readline()
+            if not line:
+                break
+            try:
+                games = framer.feed(line)
+            except ValueError as error:
+                print(f"server: {error}", file=sys.stderr)
+                return
+            for game in games:
+                await pending.put(loop.run_in_executor(executor, solve, *game))
+        if not framer.is_empty():
+            print("server: stream ended inside a game", file=sys.stderr)
+    finally:
+        if not writing.done():
+            await pending.put(None)
+        try:
+            await writing
+        except Exception as error:
+            print(f"server: {error!r}", file=sys.stderr)
+        # solves still queued after a failed one are not awaited by anybody
+        while not pending.empty():
+            answer = pending.get_nowait()
+            if answer is not None:
+                answer.cancel()
+
+
+async def serve_stdio(executor: Executor, max_pending: int) -> None:
+    loop = asyncio.get_running_loop()
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+
+    async def readline() -> bytes:
+        # a thread works for pipes, terminals and regular files alike
+        return await loop.run_in_executor(None, stdin.readline)
+
+    async def write(data: bytes) -> None:
+        stdout.write(data)
+        stdout.flush()
+
+    await answer_stream(readline, write, executor, max_pending)
+
+
+async def serve_unix(
+    path: Union[str, Path],
+    executor: Executor,
+    max_pending: int,
+    started: Optional[asyncio.Event] = None,
+) -> None:
+    """
+    Accept clients on a Unix socket at path until cancelled, sharing one
+    executor between all of them
+
+    started: set once the socket accepts connections
+    """
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        async def write(data: bytes) -> None:
+            writer.write(data)
+            await writer.drain()
+
+        try:
+            await answer_stream(reader.readline, write, executor, max_pending)
+        finally:
+            writer.close()
+
+    if os.path.exists(path):
+        os.unlink(path)
+    server = await asyncio.start_unix_server(handle, path)
+    try:
+        async with server:
+            if started is not None:
+                started.set()
+            await server.serve_forever()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--socket", help="listen on this Unix socket path")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=None,
+        help="games in flight per stream, defaults to twice the workers",
+    )
+    args = parser.parse_args()
+    max_pending = args.max_pending or 2 * args.workers
+
+    with ProcessPoolExecutor(args.workers) as executor:
+        # start the worker processes before the first game arrives
+        list(executor.map(abs, range(args.workers)))
+        if args.socket:
+            serve = serve_unix(args.socket, executor, max_pending)
+        else:
+            serve = serve_stdio(executor, max_pending)
+        try:
+            asyncio.run(serve)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
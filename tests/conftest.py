@@ -7,6 +7,8 @@ import pytest
 REPO_ROOT = Path(__file__).parent.parent
 
 sys.path.insert(0, str(REPO_ROOT / "src"))
+# seeded game generators shared with the benchmarks
+sys.path.append(str(REPO_ROOT / "benchmarks"))
 
 
 @pytest.fixture
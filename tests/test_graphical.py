@@ -0,0 +1,101 @@
+import itertools
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pytest
+
+from graphical import GraphicalGame, LocalGame, PolymatrixGame
+from q1 import Game
+
+
+@pytest.mark.timeout(1)
+def test_graphical_manual_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    g = Game(*game_args, optimize_single_strategy_counts=False)
+    local = GraphicalGame.from_payoffs(g.payoffs)
+    assert local.list_all_psne() == g.list_all_psne()
+    assert local.list_all_vwdse() == g.list_all_vwdse()
+    for profile in itertools.product(*[range(1, c + 1) for c in game_args[1]]):
+        assert local.is_psne(profile) == (list(profile) in g.list_all_psne())
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_local_games(seed: int):
+    rng = np.random.default_rng(seed)
+    player_count = 4
+    strategy_counts = rng.integers(1, 4, size=player_count).tolist()
+    neighbors = [
+        [
+            other
+            for other in range(player_count)
+            if other != player and rng.random() < 0.5
+        ]
+        for player in range(player_count)
+    ]
+    tables = [
+        rng.integers(0, 3, size=[strategy_counts[p] for p in [player] + others])
+        for player, others in enumerate(neighbors)
+    ]
+    matrices = {
+        (player, other): rng.integers(-2, 3, size=(strategy_counts[player], count))
+        for player in range(player_count)
+        for other, count in enumerate(strategy_counts)
+        if other != player and rng.random() < 0.6
+    }
+
+    for local in [
+        GraphicalGame(strategy_counts, neighbors, tables),
+        PolymatrixGame(strategy_counts, matrices),
+    ]:
+        dense = local.to_game(optimize_single_strategy_counts=False)
+        assert local.list_all_psne() == dense.list_all_psne()
+        assert local.list_all_vwdse() == dense.list_all_vwdse()
+        profile = [int(rng.integers(1, count + 1)) for count in strategy_counts]
+        payoffs = dense.payoffs[tuple(np.array(profile) - 1)]
+        assert local.get_payoffs(profile) == payoffs.tolist()
+        for player in range(player_count):
+            index: List[object] = [strategy - 1 for strategy in profile]
+            index[player] = slice(None)
+            our_payoffs = dense.payoffs[tuple(index + [player])]
+            expected = np.flatnonzero(our_payoffs == our_payoffs.max()) + 1
+            assert local.get_best_responses(player, profile) == expected.tolist()
+
+
+@pytest.mark.timeout(5)
+def test_large_polymatrix_path():
+    # neighbors on a path want to match, strategy 1 pays more than 2
+    player_count = 20000
+    coordination = np.array([[2, 0], [0, 1]])
+    matrices = {}
+    for player in range(player_count - 1):
+        matrices[player, player + 1] = coordination
+        matrices[player + 1, player] = coordination
+    g = PolymatrixGame([2] * player_count, matrices)
+
+    assert g.is_psne([1] * player_count)
+    assert g.is_psne([2] * player_count)
+    assert not g.is_psne([1] * (player_count - 1) + [2])
+    assert g.get_best_responses(0, [2] * player_count) == [2]
+    assert next(g.iter_psne()) == [1] * player_count
+    assert g.list_all_vwdse() == [[]] * player_count
+
+    # one-strategy players, as in the million_players manual game
+    lone = PolymatrixGame([1] * 30, {})
+    assert lone.list_all_psne() == [[1] * 30]
+    assert lone.list_all_vwdse() == [[1]] * 30
+
+
+def test_invalid_local_games():
+    with pytest.raises(ValueError):
+        GraphicalGame([2, 2], [[1], [0]], [np.zeros((2, 2)), np.zeros((2, 3))])
+    with pytest.raises(ValueError):
+        GraphicalGame([2, 2], [[0], []], [np.zeros((2, 2)), np.zeros(2)])
+    with pytest.raises(ValueError):
+        PolymatrixGame([2, 2], {(0, 1): np.zeros((2, 3))})
+    with pytest.raises(ValueError):
+        PolymatrixGame([2, 2], {}).is_psne([1, 3])
+    with pytest.raises(TypeError):
+        LocalGame([2, 2], [[1], [0]])
@@ -0,0 +1,64 @@
+from fractions import Fraction
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pygambit
+import pytest
+
+from mixed import is_nash, lemke_howson, lemke_howson_all, support_enumeration
+from q1 import Game
+
+
+def helper_gambit_mixed_equilibria(payoffs: np.ndarray) -> set:
+    gambit_g = pygambit.Game.from_arrays(payoffs[..., 0], payoffs[..., 1])
+    result = pygambit.nash.enummixed_solve(gambit_g, rational=True)
+    return {
+        tuple(
+            tuple(Fraction(str(eq[strategy])) for strategy in player.strategies)
+            for player in gambit_g.players
+        )
+        for eq in result.equilibria
+    }
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_bimatrix_games(seed: int):
+    rng = np.random.default_rng(seed)
+    shape = tuple(rng.integers(2, 5, size=2)) + (2,)
+    payoffs = rng.integers(-100, 100, size=shape)
+
+    support = support_enumeration(payoffs)
+    assert {(tuple(x), tuple(y)) for x, y in support} == (
+        helper_gambit_mixed_equilibria(payoffs)
+    )
+    for x, y in lemke_howson_all(payoffs):
+        assert (x, y) in support
+
+
+def test_matching_pennies():
+    payoffs = np.array([[[1, -1], [-1, 1]], [[-1, 1], [1, -1]]])
+    half = [Fraction(1, 2), Fraction(1, 2)]
+    assert support_enumeration(payoffs) == [(half, half)]
+    assert lemke_howson(payoffs, 3) == (half, half)
+    assert not is_nash(payoffs, [Fraction(1), Fraction(0)], half)
+
+
+@pytest.mark.timeout(1)
+def test_mixed_manual_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    if game_args[0] != 2:
+        pytest.skip("not a two-player game")
+    g = Game(*game_args, optimize_single_strategy_counts=False)
+
+    # pure equilibria are found by support enumeration even when degenerate
+    pure = [
+        [x.index(1) + 1, y.index(1) + 1]
+        for x, y in support_enumeration(g.payoffs)
+        if 1 in x and 1 in y
+    ]
+    assert sorted(pure) == sorted(g.list_all_psne())
+    for x, y in lemke_howson_all(g.payoffs):
+        assert is_nash(g.payoffs, x, y)
@@ -0,0 +1,680 @@
+import asyncio
+import io
+import itertools
+import socket
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pytest
+from generators import congestion_game
+
+from q1 import Game, ResultCache, map_payoffs, read_game, read_numbers
+from server import answer_stream, read_response, serve_unix
+
+
+def helper_check_expected(
+    psnes: List[List[int]],
+    vwdses: List[List[int]],
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+) -> None:
+    """
+    Compare results of a mode with the fixture, where it gives them
+    """
+    if psne_strats is not None:
+        assert sorted(psnes) == sorted(psne_strats)
+    if vwdse_strats is not None:
+        assert sorted(vwdses) == sorted(vwdse_strats)
+
+
+@pytest.mark.timeout(1)
+def test_stdin_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+    monkeypatch,
+):
+    player_count, strategy_counts, _, payoff_matrix = game_args
+    nfg_axes = list(range(player_count - 1, -1, -1)) + [player_count]
+    payoff_list = payoff_matrix.transpose(nfg_axes).reshape(-1).astype(np.int64)
+    request = f"{player_count}\n{' '.join(map(str, strategy_counts))}\n"
+    request += " ".join(map(str, payoff_list)) + "\n"
+
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(request.encode())))
+    parsed = read_game()
+    assert parsed[:2] == (player_count, strategy_counts)
+    assert np.array_equal(parsed[2], payoff_list)
+
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(request.encode())))
+    g = Game()
+    assert g.list_all_psne() == Game(*game_args).list_all_psne()
+    helper_check_expected(
+        g.list_all_psne(), g.list_all_vwdse(), psne_strats, vwdse_strats
+    )
+
+
+def test_stdin_beyond_int64(monkeypatch):
+    payoff_list = [-(10**20), 2, 3, 4, 5, 6, 7, 10**19]
+    request = "2\n2 2\n" + " ".join(map(str, payoff_list)) + "\n"
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(request.encode())))
+    g = Game()
+    assert g.list_all_vwdse() == [[2], [2]]
+    assert g.list_all_psne() == Game(2, [2, 2], payoff_list).list_all_psne()
+    assert read_numbers(io.BytesIO(b" \n\t")).size == 0
+
+
+@pytest.mark.timeout(1)
+def test_memory_budget_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+    tmp_path,
+):
+    in_memory = Game(*game_args)
+    blocked = Game(*game_args, memory_budget=256)
+    assert blocked.list_all_psne() == in_memory.list_all_psne()
+    assert blocked.list_all_vwdse() == in_memory.list_all_vwdse()
+    helper_check_expected(
+        blocked.list_all_psne(), blocked.list_all_vwdse(), psne_strats, vwdse_strats
+    )
+    halves = Game(*game_args[:3], game_args[3] / 2, memory_budget=256)
+    assert halves.list_all_psne() == in_memory.list_all_psne()
+    # mapped floats are solved as they are, never copied into integers
+    np.save(tmp_path / "halves.npy", game_args[3] / 2)
+    mapped_halves = Game(
+        *game_args[:3], map_payoffs(tmp_path / "halves.npy"), memory_budget=256
+    )
+    assert mapped_halves.payoffs.dtype.kind == "f"
+    assert mapped_halves.list_all_psne() == in_memory.list_all_psne()
+
+    np.save(tmp_path / "payoffs.npy", game_args[3])
+    mapped = Game(
+        *game_args[:3],
+        map_payoffs(tmp_path / "payoffs.npy"),
+        memory_budget=256,
+    )
+    assert mapped.list_all_psne() == in_memory.list_all_psne()
+
+
+@pytest.mark.timeout(5)
+def test_worker_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    in_memory = Game(*game_args)
+    parallel = Game(*game_args, workers=2)
+    assert parallel.list_all_psne() == in_memory.list_all_psne()
+    assert parallel.list_all_vwdse() == in_memory.list_all_vwdse()
+    helper_check_expected(
+        parallel.list_all_psne(), parallel.list_all_vwdse(), psne_strats, vwdse_strats
+    )
+
+
+@pytest.mark.timeout(1)
+def test_dominance_elimination_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    in_memory = Game(*game_args)
+    reduced = Game(*game_args, eliminate_dominated_strategies=True)
+    # the reduced game is built by the first PSNE search, not by __init__
+    assert "reduced_game" not in reduced.get_stats()
+    assert reduced.list_all_psne() == in_memory.list_all_psne()
+    assert reduced.list_all_vwdse() == in_memory.list_all_vwdse()
+    assert reduced.get_psne_array().tolist() == in_memory.list_all_psne()
+    helper_check_expected(
+        reduced.list_all_psne(), reduced.list_all_vwdse(), psne_strats, vwdse_strats
+    )
+    cached = Game(*game_args, eliminate_dominated_strategies=True, cache=ResultCache())
+    assert cached.list_all_psne() == in_memory.list_all_psne()
+
+
+@pytest.mark.timeout(1)
+def test_print_output_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+    capsys,
+):
+    g = Game(*game_args)
+    psnes = g.list_all_psne()
+    vwdses = g.list_all_vwdse()
+    helper_check_expected(psnes, vwdses, psne_strats, vwdse_strats)
+    expected = [str(len(psnes))]
+    expected += [" ".join(map(str, psne)) for psne in psnes]
+    expected += [f"{len(vwdse)} " + " ".join(map(str, vwdse)) for vwdse in vwdses]
+
+    g.print_output()
+    assert capsys.readouterr().out.splitlines() == expected
+
+
+@pytest.mark.timeout(1)
+def test_compact_payoff_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    player_count, strategy_counts, _, payoff_matrix = game_args
+    nfg_axes = list(range(player_count - 1, -1, -1)) + [player_count]
+    payoff_list = payoff_matrix.transpose(nfg_axes).reshape(-1)
+
+    in_memory = Game(*game_args)
+    compact = Game(player_count, strategy_counts, payoff_list)
+    assert compact.payoffs.dtype == np.int8
+    assert compact.list_all_psne() == in_memory.list_all_psne()
+    assert compact.list_all_vwdse() == in_memory.list_all_vwdse()
+    helper_check_expected(
+        compact.list_all_psne(), compact.list_all_vwdse(), psne_strats, vwdse_strats
+    )
+
+
+@pytest.mark.timeout(1)
+def test_batch_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    player_count, strategy_counts, _, payoff_matrix = game_args
+    g = Game(*game_args)
+    expected = (g.list_all_psne(), g.list_all_vwdse())
+
+    payoff_stack = np.stack([payoff_matrix, payoff_matrix])
+    results = Game.solve_batch(player_count, strategy_counts, payoff_stack)
+    assert results == [expected, expected]
+    helper_check_expected(*results[0], psne_strats, vwdse_strats)
+    assert Game.solve_batch(player_count, strategy_counts, payoff_stack[:0]) == []
+
+
+@pytest.mark.timeout(1)
+def test_streaming_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    g = Game(*game_args)
+    psne_list = g.list_all_psne()
+    assert list(g.iter_psne()) == psne_list
+    helper_check_expected(psne_list, [], psne_strats, None)
+    assert g.count_psne() == len(psne_list)
+    assert g.has_psne() == (len(psne_list) > 0)
+    assert g.first_psne(1) == psne_list[:1]
+
+    # a fresh game stops at its first PSNE without every player's maxima
+    lazy = Game(*game_args)
+    assert lazy.has_psne() == (len(psne_list) > 0)
+    assert "maxima" not in lazy.get_stats()["phase_seconds"]
+
+
+@pytest.mark.timeout(1)
+def test_best_response_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    g = Game(*game_args)
+    psne_list = g.list_all_psne()
+    helper_check_expected(psne_list, [], psne_strats, None)
+    for better_response in (False, True):
+        psne = g.find_psne_by_best_response(better_response=better_response, seed=0)
+        if psne_list:
+            assert psne is None or psne in psne_list
+        else:
+            assert psne is None
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_best_response_congestion(seed: int):
+    # potential games such as congestion games always converge to a PSNE
+    strategy_counts = [3, 4, 3, 2]
+    payoffs = congestion_game(strategy_counts, np.random.default_rng(seed))
+    g = Game(len(strategy_counts), strategy_counts, [], payoffs)
+    psne_list = g.list_all_psne()
+    for better_response in (False, True):
+        psne = g.find_psne_by_best_response(
+            better_response=better_response, restarts=1, seed=seed
+        )
+        assert psne in psne_list
+
+
+@pytest.mark.timeout(1)
+def test_stats_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+    capsys,
+):
+    g = Game(*game_args)
+    g.print_output()
+    if psne_strats is not None:
+        assert capsys.readouterr().out.startswith(f"{len(psne_strats)}\n")
+    stats = g.get_stats()
+    assert {"parse", "maxima", "best_responses", "output"} <= stats[
+        "phase_seconds"
+    ].keys()
+    assert stats["profiles_visited"] >= np.prod(g.payoffs.shape[:-1])
+    assert stats["tensors"]["payoffs"]["shape"] == list(g.payoffs.shape)
+
+
+@pytest.mark.timeout(5)
+def test_server_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+    tmp_path,
+):
+    player_count, strategy_counts, _, payoff_matrix = game_args
+    nfg_axes = list(range(player_count - 1, -1, -1)) + [player_count]
+    payoff_list = payoff_matrix.transpose(nfg_axes).reshape(-1).astype(np.int64)
+    request = f"{player_count}\n{' '.join(map(str, strategy_counts))}\n"
+    request += " ".join(map(str, payoff_list)) + "\n"
+    expected = io.StringIO()
+    Game(*game_args).print_output(expected)
+    if psne_strats is not None:
+        assert expected.getvalue().startswith(f"{len(psne_strats)}\n")
+
+    path = str(tmp_path / "q1.sock")
+
+    def client() -> List[bytes]:
+        with socket.socket(socket.AF_UNIX) as connection:
+            connection.connect(path)
+            stream = connection.makefile("rwb")
+            # two games in one write, the second split across writes
+            stream.write(request.encode() * 2)
+            stream.write(request.encode()[:3])
+            stream.flush()
+            answers = [read_response(stream, player_count) for _ in range(2)]
+            stream.write(request.encode()[3:])
+            stream.flush()
+            answers.append(read_response(stream, player_count))
+            return answers
+
+    async def run() -> List[bytes]:
+        started = asyncio.Event()
+        with ThreadPoolExecutor(2) as executor:
+            serving = asyncio.create_task(serve_unix(path, executor, 4, started))
+            await started.wait()
+            answers = await asyncio.get_running_loop().run_in_executor(None, client)
+            serving.cancel()
+        return answers
+
+    assert asyncio.run(run()) == [expected.getvalue().encode()] * 3
+
+    # rational payoffs are answered across blank lines, a zero count or a
+    # typo ends the stream without a crash
+    rational = f"{player_count}\n{' '.join(map(str, strategy_counts))}\n"
+    rational += " ".join(f"{payoff}/7" for payoff in payoff_list) + "\n"
+    lines = [b"\n", rational.encode(), b" \n", request.encode(), b"0\n"]
+    written: List[bytes] = []
+
+    async def readline() -> bytes:
+        return lines.pop(0) if lines else b""
+
+    async def write(data: bytes) -> None:
+        written.append(data)
+
+    with ThreadPoolExecutor(1) as executor:
+        asyncio.run(answer_stream(readline, write, executor, 2))
+    assert written == [expected.getvalue().encode()] * 2
+    lines = [b"2 x\n", request.encode()]
+    written.clear()
+    with ThreadPoolExecutor(1) as executor:
+        asyncio.run(answer_stream(readline, write, executor, 2))
+    assert written == []
+
+
+@pytest.mark.timeout(1)
+def test_cache_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+    tmp_path,
+):
+    uncached = Game(*game_args)
+    expected = (uncached.list_all_psne(), uncached.list_all_vwdse())
+
+    cache = ResultCache(max_entries=1, path=tmp_path / "cache.sqlite")
+    first = Game(*game_args, cache=cache)
+    assert (first.list_all_psne(), first.list_all_vwdse()) == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+    helper_check_expected(*expected, psne_strats, vwdse_strats)
+    second = Game(*game_args, cache=cache)
+    assert (second.list_all_psne(), second.list_all_vwdse()) == expected
+    assert (cache.hits, cache.misses) == (3, 1)
+    # what callers get back is theirs to change
+    second.list_all_psne().append([0] * len(game_args[1]))
+    second.list_all_vwdse().clear()
+    third = Game(*game_args, cache=cache)
+    assert (third.list_all_psne(), third.list_all_vwdse()) == expected
+
+    cache.put("other game", ([], []))
+    assert cache.to_dict()["size"] == 1
+    cache.close()
+
+    reopened = ResultCache(path=tmp_path / "cache.sqlite")
+    reloaded = Game(*game_args, cache=reopened)
+    assert (reloaded.list_all_psne(), reloaded.list_all_vwdse()) == expected
+    assert (reopened.hits, reopened.misses) == (2, 0)
+    reopened.close()
+
+
+@pytest.mark.timeout(1)
+def test_update_payoffs_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    player_count, strategy_counts, _, payoff_matrix = game_args
+    original = payoff_matrix.copy()
+    g = Game(*game_args)
+    helper_check_expected(
+        g.list_all_psne(), g.list_all_vwdse(), psne_strats, vwdse_strats
+    )
+
+    rng = np.random.default_rng(0)
+    updated = np.array(payoff_matrix, dtype=np.int64)
+    for _ in range(3):
+        profile = [int(rng.integers(1, count + 1)) for count in strategy_counts]
+        values = rng.integers(-200, 200, size=player_count)
+        g.update_payoffs([profile], [values])
+        updated[tuple(np.array(profile) - 1)] = values
+
+        fresh = Game(player_count, strategy_counts, [], updated.copy())
+        assert g.list_all_psne() == fresh.list_all_psne()
+        assert g.list_all_vwdse() == fresh.list_all_vwdse()
+    assert np.array_equal(payoff_matrix, original)
+
+
+@pytest.mark.timeout(1)
+def test_symmetric_detection_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    full = Game(*game_args)
+    detected = Game(*game_args, symmetric=None)
+    assert detected.list_all_psne() == full.list_all_psne()
+    assert detected.list_all_vwdse() == full.list_all_vwdse()
+    helper_check_expected(
+        detected.list_all_psne(), detected.list_all_vwdse(), psne_strats, vwdse_strats
+    )
+
+
+@pytest.mark.parametrize("player_count,strategy_count", [(2, 3), (3, 2), (4, 3)])
+def test_symmetric_games(player_count: int, strategy_count: int):
+    # payoff of a player depends on its strategy and how many share it
+    rng = np.random.default_rng(player_count * strategy_count)
+    crowding = rng.integers(0, 3, size=(strategy_count, player_count + 1))
+    strategy_counts = [strategy_count] * player_count
+    strategies = np.indices(strategy_counts)
+    payoffs = np.stack(
+        [
+            crowding[strategies[pidx], (strategies == strategies[pidx]).sum(axis=0)]
+            for pidx in range(player_count)
+        ],
+        axis=-1,
+    )
+    full = Game(player_count, strategy_counts, [], payoffs)
+    symmetric = Game(player_count, strategy_counts, [], payoffs, symmetric=None)
+    assert symmetric.symmetric
+    assert symmetric.list_all_psne() == full.list_all_psne()
+    assert symmetric.list_all_vwdse() == full.list_all_vwdse()
+
+
+@pytest.mark.timeout(1)
+def test_rational_payoff_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    player_count, strategy_counts, _, payoff_matrix = game_args
+    nfg_axes = list(range(player_count - 1, -1, -1)) + [player_count]
+    payoff_list = payoff_matrix.transpose(nfg_axes).reshape(-1).tolist()
+    g = Game(*game_args)
+
+    # dividing every payoff by 7 and shifting it by a half keeps comparisons
+    rational = [str(Fraction(int(value), 7) + Fraction(1, 2)) for value in payoff_list]
+    scaled = Game(player_count, strategy_counts, rational)
+    assert scaled.payoffs.dtype != object
+    assert scaled.list_all_psne() == g.list_all_psne()
+    assert scaled.list_all_vwdse() == g.list_all_vwdse()
+    helper_check_expected(
+        scaled.list_all_psne(), scaled.list_all_vwdse(), psne_strats, vwdse_strats
+    )
+
+    # too wide for int64, so kept as Python integers
+    huge = [Fraction(int(value) + 10**20, 3) for value in payoff_list]
+    wide = Game(player_count, strategy_counts, huge)
+    assert wide.list_all_psne() == g.list_all_psne()
+    assert wide.list_all_vwdse() == g.list_all_vwdse()
+
+    # Fraction tensors are scaled to integers just like lists, float ones
+    # compare exactly as floats
+    as_fractions = np.vectorize(lambda v: Fraction(int(v), 4), otypes=[object])
+    for matrix in [payoff_matrix.astype(float) / 4, as_fractions(payoff_matrix)]:
+        exact = Game(player_count, strategy_counts, [], matrix)
+        assert exact.payoffs.dtype.kind == ("f" if matrix.dtype == float else "i")
+        assert exact.list_all_psne() == g.list_all_psne()
+        assert exact.list_all_vwdse() == g.list_all_vwdse()
+        profile = [1] * player_count
+        exact.update_payoffs(
+            [profile], [[Fraction(1, scale) for scale in exact.payoff_scales]]
+        )
+    floats = Game(player_count, strategy_counts, [], payoff_matrix / 5)
+    floats.update_payoffs([[1] * player_count], [[Fraction(1, 5)] * player_count])
+
+    # decimal tokens are scaled in bulk, to the same integers as Fractions
+    decimals = np.array([f"{int(value) / 4:.3f}".encode() for value in payoff_list])
+    parsed = Game(player_count, strategy_counts, decimals)
+    assert parsed.payoffs.dtype.kind == "i"
+    quarters = [str(Fraction(int(value), 4)) for value in payoff_list]
+    assert parsed.payoff_scales == Game(*game_args[:2], quarters).payoff_scales
+    assert parsed.list_all_psne() == g.list_all_psne()
+    assert parsed.list_all_vwdse() == g.list_all_vwdse()
+
+
+def helper_write_nfg_files(
+    tmp_path, player_count: int, strategy_counts: List[int], payoff_list: List[int]
+) -> Tuple:
+    players = " ".join(f'"Player {pidx + 1}"' for pidx in range(player_count))
+    header = f'NFG 1 R "a \\"quoted\\" {{title}}" {{ {players} }}'
+
+    payoff_path = tmp_path / "payoff.nfg"
+    counts = " ".join(map(str, strategy_counts))
+    payoffs = " ".join(map(str, payoff_list))
+    payoff_path.write_text(f'{header} {{ {counts} }}\n""\n\n{payoffs}\n')
+
+    # every profile gets its own outcome, listed in reverse
+    strategies = "\n".join(
+        "{ " + " ".join(f'"s{i}"' for i in range(count)) + " }"
+        for count in strategy_counts
+    )
+    profile_count = len(payoff_list) // max(player_count, 1)
+    outcomes = "\n".join(
+        '{ "" '
+        + ", ".join(map(str, payoff_list[p * player_count : (p + 1) * player_count]))
+        + " }"
+        for p in reversed(range(profile_count))
+    )
+    numbers = " ".join(str(profile_count - p) for p in range(profile_count))
+    outcome_path = tmp_path / "outcome.nfg"
+    outcome_path.write_text(
+        f'{header}\n\n{{ {strategies}\n}}\n""\n\n{{\n{outcomes}\n}}\n{numbers}\n'
+    )
+    return payoff_path, outcome_path
+
+
+@pytest.mark.timeout(1)
+def test_nfg_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+    tmp_path,
+):
+    player_count, strategy_counts, _, payoff_matrix = game_args
+    nfg_axes = list(range(player_count - 1, -1, -1)) + [player_count]
+    payoff_list = payoff_matrix.transpose(nfg_axes).reshape(-1).astype(int).tolist()
+    g = Game(*game_args)
+
+    for path in helper_write_nfg_files(
+        tmp_path, player_count, strategy_counts, payoff_list
+    ):
+        for _ in range(2):
+            # parsed and cached the first time, mapped from the cache next
+            loaded = Game.from_nfg(path)
+            assert loaded.list_all_psne() == g.list_all_psne()
+            assert loaded.list_all_vwdse() == g.list_all_vwdse()
+            helper_check_expected(
+                loaded.list_all_psne(),
+                loaded.list_all_vwdse(),
+                psne_strats,
+                vwdse_strats,
+            )
+        assert isinstance(np.load(f"{path}.npy", mmap_mode="r"), np.memmap)
+
+        # a mapped game can be updated without writing to the sidecar file
+        updated = Game(*game_args)
+        for game in [loaded, updated]:
+            game.update_payoffs([[1] * player_count], [[10**6] * player_count])
+        assert loaded.list_all_psne() == updated.list_all_psne()
+        assert loaded.list_all_vwdse() == updated.list_all_vwdse()
+        assert Game.from_nfg(path).list_all_psne() == g.list_all_psne()
+
+
+@pytest.mark.timeout(1)
+def test_best_response_index_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    psnes = Game(*game_args).list_all_psne()
+    helper_check_expected(psnes, [], psne_strats, None)
+    g = Game(*game_args)
+    for profile in itertools.product(*[range(1, c + 1) for c in game_args[1]]):
+        assert g.is_psne(list(profile)) == (list(profile) in psnes)
+    # later PSNE listings AND the index instead of comparing payoffs again
+    assert g.list_all_psne() == psnes
+    profile_count = int(np.prod(g.payoffs.shape[:-1]))
+    assert g.best_response_index.nbytes == 8 * g.player_count * -(-profile_count // 64)
+
+
+@pytest.mark.timeout(5)
+def test_parallel_parse_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+    tmp_path,
+):
+    player_count, strategy_counts, _, payoff_matrix = game_args
+    nfg_axes = list(range(player_count - 1, -1, -1)) + [player_count]
+    payoff_list = payoff_matrix.transpose(nfg_axes).reshape(-1)
+    path = tmp_path / "game.txt"
+    path.write_text(
+        f"{player_count}\n{' '.join(map(str, strategy_counts))}\n"
+        + "\n".join(map(str, payoff_list))
+    )
+
+    parsed = read_game(path, workers=2)
+    assert parsed[:2] == (player_count, strategy_counts)
+    assert np.array_equal(parsed[2], payoff_list)
+    g = Game(*parsed)
+    assert g.list_all_psne() == Game(*game_args).list_all_psne()
+    helper_check_expected(
+        g.list_all_psne(), g.list_all_vwdse(), psne_strats, vwdse_strats
+    )
+
+    # integers beyond int64 are parsed exactly instead of clamped
+    shifted = [int(value) + 10**19 for value in payoff_list]
+    path.write_text(
+        f"{player_count}\n{' '.join(map(str, strategy_counts))}\n"
+        + "\n".join(map(str, shifted))
+    )
+    parsed = read_game(path, workers=2)
+    assert [int(token) for token in parsed[2]] == shifted
+    assert Game(*parsed).list_all_psne() == g.list_all_psne()
+
+
+@pytest.mark.timeout(1)
+def test_binary_output_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+    tmp_path,
+):
+    g = Game(*game_args)
+    psnes = g.list_all_psne()
+    text = io.StringIO()
+    g.print_output(text)
+    lines = text.getvalue().splitlines(keepends=True)
+
+    for name in ["psne.npy", "psne.i32"]:
+        short = io.StringIO()
+        Game(*game_args).print_output(short, psne_file=tmp_path / name)
+        # the rows are left out of the text, which keeps count and VWDSE
+        assert short.getvalue() == lines[0] + "".join(lines[1 + len(psnes) :])
+    saved = np.load(tmp_path / "psne.npy", mmap_mode="r")
+    assert saved.dtype == np.int32 and saved.tolist() == psnes
+    helper_check_expected(saved.tolist(), [], psne_strats, None)
+    raw = np.fromfile(tmp_path / "psne.i32", dtype="<i4")
+    assert raw.reshape(len(psnes), len(game_args[1])).tolist() == psnes
+
+
+@pytest.mark.timeout(1)
+def test_regret_games(
+    game_args: Tuple,
+    psne_strats: Optional[List[List[int]]],
+    vwdse_strats: Optional[List[List[int]]],
+):
+    player_count, strategy_counts, _, payoff_matrix = game_args
+    g = Game(*game_args)
+    assert g.list_epsilon_psne(0) == g.list_all_psne()
+    helper_check_expected(g.list_epsilon_psne(0), [], psne_strats, None)
+
+    expected = {}
+    for profile in itertools.product(*[range(count) for count in strategy_counts]):
+        regret = 0
+        for pidx in range(player_count):
+            fiber = list(profile)
+            fiber[pidx] = slice(None)
+            our_payoffs = payoff_matrix[tuple(fiber) + (pidx,)]
+            regret = max(regret, our_payoffs.max() - payoff_matrix[profile + (pidx,)])
+        expected[tuple(strategy + 1 for strategy in profile)] = int(regret)
+    ranked = sorted(expected.items(), key=lambda item: (item[1], item[0][::-1]))
+    assert g.top_k_min_regret(len(ranked)) == [(list(p), r) for p, r in ranked]
+    assert g.top_k_min_regret(1) == [(list(ranked[0][0]), ranked[0][1])]
+    for epsilon in [1, 2]:
+        close = [list(p) for p, r in expected.items() if r <= epsilon]
+        assert g.list_epsilon_psne(epsilon) == sorted(close, key=lambda p: p[::-1])
+
+    # the regret of payoffs divided by 7 is reported divided by 7 as well
+    nfg_axes = list(range(player_count - 1, -1, -1)) + [player_count]
+    payoff_list = payoff_matrix.transpose(nfg_axes).reshape(-1).tolist()
+    rational = [str(Fraction(int(value), 7)) for value in payoff_list]
+    scaled = Game(player_count, strategy_counts, rational)
+    assert scaled.top_k_min_regret(len(ranked)) == [
+        (list(p), Fraction(r, 7)) for p, r in ranked
+    ]
+    assert scaled.list_epsilon_psne(Fraction(2, 7)) == g.list_epsilon_psne(2)
+
+    # so is the regret of float and Fraction tensors divided by 4
+    as_fractions = np.vectorize(lambda v: Fraction(int(v), 4), otypes=[object])
+    for matrix in [payoff_matrix.astype(float) / 4, as_fractions(payoff_matrix)]:
+        exact = Game(player_count, strategy_counts, [], matrix)
+        assert exact.top_k_min_regret(len(ranked)) == [
+            (list(p), Fraction(r, 4)) for p, r in ranked
+        ]
+        assert exact.list_epsilon_psne(0.5) == g.list_epsilon_psne(2)
+
+
+def test_non_integer_regret():
+    payoffs = np.array([[[2.0, 2.0], [6.0, 4.0]], [[4.0, 6.0], [2.0, 2.0]]])
+    expected = [([2, 1], 0), ([1, 2], 0), ([1, 1], 2), ([2, 2], 4)]
+    assert Game(2, [2, 2], [], payoffs).top_k_min_regret(4) == expected
+    halves = np.vectorize(lambda v: Fraction(int(v), 2), otypes=[object])(payoffs)
+    assert Game(2, [2, 2], [], halves).top_k_min_regret(4) == [
+        (profile, Fraction(regret, 2)) for profile, regret in expected
+    ]
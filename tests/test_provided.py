@@ -32,27 +32,21 @@ def helper_convert_gambit_psne_to_ours(
 
 
 @pytest.mark.timeout(1)
-def test_provided_games(nfg_str: str):
-    nfg_str = nfg_str.strip()
-
-    if nfg_str.split(" ", 4)[2] != "R":
-        pytest.skip("not correct format")
-
-    gambit_g = pygambit.Game.parse_game(nfg_str)
+def test_provided_games(nfg_str: str, tmp_path):
+    gambit_g = pygambit.Game.parse_game(nfg_str.strip())
 
     n = len(gambit_g.players)
-    utility_list = list(map(eval, nfg_str.split("\n")[-1].split()))
     n_strategies = [len(gambit_g.players[i].strategies) for i in range(n)]
 
-    if len(utility_list) != n * np.prod(n_strategies):
-        pytest.skip("not correct format")
-
-    if len(utility_list) > int(1e6):
+    # the gambit solver, not the parser, is what cannot keep up with these
+    if n * np.prod(n_strategies) > int(1e6):
         pytest.skip("too large test case")
 
     psne_gambit_g = pygambit.nash.enumpure_solve(gambit_g, external=True)
 
-    g = Game(n, n_strategies, utility_list)
+    nfg_path = tmp_path / "game.nfg"
+    nfg_path.write_text(nfg_str)
+    g = Game.from_nfg(nfg_path)
     psne_g = g.list_all_psne()
 
     assert sorted(psne_g) == sorted(